@@ -20,7 +20,7 @@ Groups all commands together for the main CLI dispatcher.
 """
 
 import argparse
-from typing import Dict, Callable, Any
+from typing import Dict, Callable, Any, Optional
 
 # Lazy import commands for performance optimization
 _command_modules = {}
@@ -33,77 +33,60 @@ def _import_command_module(module_name: str):
     return module
 
 
-def register_all_commands(subparsers: argparse._SubParsersAction) -> None:
+# Command name -> (module name, registrar function), in help listing order
+_COMMAND_REGISTRARS = {
+    "init": ("init", "register_init_command"),
+    "run": ("run", "register_run_command"),
+    "audit": ("audit", "register_audit_command"),
+    "logs": ("logs", "register_logs_command"),
+    "status": ("status", "register_status_command"),
+    "templates": ("templates", "register_templates_command"),
+    "clean": ("clean", "register_clean_command"),
+    "testing": ("testing", "register_testing_command"),
+    "setup": ("setup", "register_setup_command"),
+    "doctor": ("doctor", "register_doctor_command"),
+    "files": ("files", "register_files_command"),
+    "compliance": ("compliance", "register_compliance_command"),
+    "security": ("security", "register_security_command"),
+    "cage": ("security", "register_cage_command"),  # Alias for security command
+    "protect": ("protect", "register_protect_command"),
+    "http": ("http", "register_http_command"),
+    "output": ("output", "register_output_command"),
+    "docs": ("docs", "register_docs_command"),
+    "timeline": ("timeline", "register_timeline_command"),
+    "workflow": ("workflow", "register_workflow_command"),
+    "serve": ("serve", "register_serve_command"),
+    "dashboard": ("dashboard", "register_dashboard_command"),
+}
+
+
+def register_command(subparsers: argparse._SubParsersAction, name: str) -> None:
     """
-    Register all CLI commands with the argument parser using lazy loading for performance.
+    Register a single CLI command, importing only its module.
 
     Args:
         subparsers: Subparsers action from main parser
+        name: Command name (must be a key of the command registry)
     """
-    # Register each command with lazy loading
-    init_module = _import_command_module('init')
-    init_module.register_init_command(subparsers)
-
-    run_module = _import_command_module('run')
-    run_module.register_run_command(subparsers)
-
-    audit_module = _import_command_module('audit')
-    audit_module.register_audit_command(subparsers)
-
-    logs_module = _import_command_module('logs')
-    logs_module.register_logs_command(subparsers)
-
-    status_module = _import_command_module('status')
-    status_module.register_status_command(subparsers)
-
-    templates_module = _import_command_module('templates')
-    templates_module.register_templates_command(subparsers)
-
-    clean_module = _import_command_module('clean')
-    clean_module.register_clean_command(subparsers)
-
-    testing_module = _import_command_module('testing')
-    testing_module.register_testing_command(subparsers)
-
-    setup_module = _import_command_module('setup')
-    setup_module.register_setup_command(subparsers)
-
-    doctor_module = _import_command_module('doctor')
-    doctor_module.register_doctor_command(subparsers)
-
-    files_module = _import_command_module('files')
-    files_module.register_files_command(subparsers)
+    module_name, registrar = _COMMAND_REGISTRARS[name]
+    module = _import_command_module(module_name)
+    getattr(module, registrar)(subparsers)
 
-    compliance_module = _import_command_module('compliance')
-    compliance_module.register_compliance_command(subparsers)
 
-    security_module = _import_command_module('security')
-    security_module.register_security_command(subparsers)
-    security_module.register_cage_command(subparsers)  # Alias for security command
+def is_known_command(name: Optional[str]) -> bool:
+    """Check whether name is a registered top-level command."""
+    return name in _COMMAND_REGISTRARS
 
-    protect_module = _import_command_module('protect')
-    protect_module.register_protect_command(subparsers)
 
-    http_module = _import_command_module('http')
-    http_module.register_http_command(subparsers)
-
-    output_module = _import_command_module('output')
-    output_module.register_output_command(subparsers)
-
-    docs_module = _import_command_module('docs')
-    docs_module.register_docs_command(subparsers)
-
-    timeline_module = _import_command_module('timeline')
-    timeline_module.register_timeline_command(subparsers)
-
-    workflow_module = _import_command_module('workflow')
-    workflow_module.register_workflow_command(subparsers)
-
-    serve_module = _import_command_module('serve')
-    serve_module.register_serve_command(subparsers)
+def register_all_commands(subparsers: argparse._SubParsersAction) -> None:
+    """
+    Register all CLI commands with the argument parser using lazy loading for performance.
 
-    dashboard_module = _import_command_module('dashboard')
-    dashboard_module.register_dashboard_command(subparsers)
+    Args:
+        subparsers: Subparsers action from main parser
+    """
+    for name in _COMMAND_REGISTRARS:
+        register_command(subparsers, name)
 
 
 def get_command_descriptions() -> Dict[str, str]:
@@ -139,4 +122,4 @@ def get_command_descriptions() -> Dict[str, str]:
     }
 
 
-__all__ = ["register_all_commands", "get_command_descriptions"]
+__all__ = ["register_all_commands", "register_command", "is_known_command", "get_command_descriptions"]
@@ -22,10 +22,12 @@ Keep this tiny and focused.
 import json
 import os
 import sys
+from functools import lru_cache
 from typing import Any, Dict, Optional, List
 
 from akios._version import __version__
 from ..config import get_settings
+from ..core.ui.commands import SETUP_COMMAND, HELLO_WORKFLOW_COMMAND
 from ..core.ui.rich_output import get_theme_color
 
 
@@ -64,18 +66,26 @@ def output_result(result: Any, json_mode: bool = False, success_message: Optiona
         try:
             from rich.console import Console
             from rich.syntax import Syntax
+            from rich.style import Style
+            from rich.text import Text
             import json as json_module
-            from ..core.ui.rich_output import get_theme_color
             _console = Console()
         except ImportError:
             _console = None
         
         if isinstance(result, dict):
             if _console:
+                # Build styles once and append values to Text objects so Rich
+                # does not have to re-parse markup for every key/value pair
+                key_style = Style.parse(f"bold {get_theme_color('warning')}")
+                true_style = Style.parse(f"bold {get_theme_color('success')}")
+                false_style = Style.parse(f"bold {get_theme_color('error')}")
+                number_style = Style.parse(f"bold {get_theme_color('info')}")
+                text_style = Style.parse(get_theme_color('info'))
+
                 # Format dict with proper colors for readability
                 for key, value in result.items():
-                    # Format key
-                    key_str = f"[bold {get_theme_color('warning')}]{key}:[/bold {get_theme_color('warning')}]"
+                    line = Text(f"{key}:", style=key_style)
                     
                     # Format value based on type
                     if isinstance(value, (dict, list)):
@@ -84,19 +94,19 @@ def output_result(result: Any, json_mode: bool = False, success_message: Optiona
                         # Limit length for very large outputs
                         if len(value_str) > 1000:
                             value_str = value_str[:1000] + "...\\n(truncated)"
-                        _console.print(f"{key_str}")
+                        _console.print(line)
                         syntax = Syntax(value_str, "json", theme="monokai", word_wrap=True)
                         _console.print(syntax)
+                        continue
                     elif isinstance(value, bool):
-                        color = get_theme_color('success') if value else get_theme_color('error')
-                        value_str = f"[bold {color}]{value}[/]"
-                        _console.print(f"{key_str} {value_str}")
+                        value_style = true_style if value else false_style
                     elif isinstance(value, (int, float)):
-                        value_str = f"[bold {get_theme_color('info')}]{value}[/]"
-                        _console.print(f"{key_str} {value_str}")
+                        value_style = number_style
                     else:
-                        value_str = f"[{get_theme_color('info')}]{value}[/]"
-                        _console.print(f"{key_str} {value_str}")
+                        value_style = text_style
+                    line.append(" ")
+                    line.append(str(value), style=value_style)
+                    _console.print(line)
             else:
                 for key, value in result.items():
                     print(f"{key}: {value}")
@@ -118,6 +128,19 @@ def output_result(result: Any, json_mode: bool = False, success_message: Optiona
                 print(success_message)
 
 
+def _write_json_stderr(data: Dict[str, Any]) -> None:
+    """Serialize data once and write it straight to the stderr byte stream."""
+    payload = (json.dumps(data, indent=2) + "\n").encode("utf-8")
+    buffer = getattr(sys.stderr, "buffer", None)
+    if buffer is None:
+        # Replaced/captured stderr (e.g. StringIO) has no underlying buffer
+        sys.stderr.write(payload.decode("utf-8"))
+        return
+    sys.stderr.flush()  # Keep ordering with anything already written as text
+    buffer.write(payload)
+    buffer.flush()
+
+
 def handle_cli_error(error: Exception, json_mode: bool = False) -> int:
     """
     Handle CLI error and return appropriate exit code.
@@ -157,8 +180,7 @@ def handle_cli_error(error: Exception, json_mode: bool = False) -> int:
                 "severity": fingerprint.severity.value,
                 "suggestions": fingerprint.recovery_suggestions
             }
-            json.dump(error_data, sys.stderr, indent=2)
-            print(file=sys.stderr)
+            _write_json_stderr(error_data)
     except ImportError:
         # Fallback if error classifier not available
         if json_mode:
@@ -167,8 +189,7 @@ def handle_cli_error(error: Exception, json_mode: bool = False) -> int:
                 "message": message,
                 "exit_code": exit_code
             }
-            json.dump(error_data, sys.stderr, indent=2)
-            print(file=sys.stderr)
+            _write_json_stderr(error_data)
         else:
             from ..core.ui.semantic_colors import print_error
             print_error(message)
@@ -209,7 +230,6 @@ def get_version_info() -> Dict[str, str]:
 
 def _determine_ai_mode(status_data: Dict[str, Any]) -> str:
     """Determine the AI mode string for status display."""
-    from ..core.ui.rich_output import get_theme_color
     api_keys_status = status_data.get('api_keys_setup', {})
     mock_mode = api_keys_status.get('mock_mode_enabled', True)
 
@@ -240,7 +260,6 @@ def _determine_ai_mode(status_data: Dict[str, Any]) -> str:
 
 def _format_budget_status(cost_summary: Dict[str, Any]) -> str:
     """Format budget status string."""
-    from ..core.ui.rich_output import get_theme_color
     settings = get_settings()
     total_cost = cost_summary.get('total_cost', 0.0)
 
@@ -331,6 +350,17 @@ def _format_verbose_details(status_data: Dict[str, Any], workflow_info: Dict[str
     return lines
 
 
+# is_strict -> (posture label, theme color name)
+_SECURITY_POSTURES = {
+    True: ("ELEVATED (STRICT)", "success"),
+    False: ("RELAXED (DEV)", "warning"),
+}
+
+# Next-step hints are constant for the process, so render them once
+_NEXT_HINT_MOCK = f"💡 [dim]Next:[/dim] Run [{get_theme_color('info')}]'{SETUP_COMMAND}'[/{get_theme_color('info')}] to configure real AI providers"
+_NEXT_HINT_REAL = f"💡 [dim]Next:[/dim] Run [{get_theme_color('info')}]'{HELLO_WORKFLOW_COMMAND}'[/{get_theme_color('info')}] to test AI"
+
+
 def format_status_info(status_data: Dict[str, Any], workflow_filter: str = None, verbose: bool = False) -> str:
     """
     Format status information for display with user-friendly interface.
@@ -363,27 +393,24 @@ def format_status_info(status_data: Dict[str, Any], workflow_filter: str = None,
     lines.append(last_run_info)
 
     # Security status
-    from ..config import get_settings
     settings = get_settings()
     
+    network_allowed = settings.network_access_allowed
+    pii_enabled = settings.pii_redaction_enabled
+    budget_limit = settings.budget_limit_per_run
+
     # Determine posture based on key variables
     # Strict means: No network, PII enabled, Low budget (< $5)
-    is_strict = (
-        not settings.network_access_allowed and 
-        settings.pii_redaction_enabled and 
-        settings.budget_limit_per_run <= 5.0
-    )
-    
-    posture = "ELEVATED (STRICT)" if is_strict else "RELAXED (DEV)"
-    posture_color = "success" if is_strict else "warning"
+    is_strict = not network_allowed and pii_enabled and budget_limit <= 5.0
+    posture, posture_color = _SECURITY_POSTURES[is_strict]
     
     lines.append(f"🔒 Security: [{get_theme_color(posture_color)}]{posture}[/{get_theme_color(posture_color)}]")
     
     # Add concise details line
-    net_status = "BLOCKED" if not settings.network_access_allowed else "ALLOWED"
-    pii_status = "ENABLED" if settings.pii_redaction_enabled else "DISABLED"
+    net_status = "ALLOWED" if network_allowed else "BLOCKED"
+    pii_status = "ENABLED" if pii_enabled else "DISABLED"
     
-    lines.append(f"   [dim]• Network: {net_status} | PII: {pii_status} | Budget: ${settings.budget_limit_per_run:.2f}[/dim]")
+    lines.append(f"   [dim]• Network: {net_status} | PII: {pii_status} | Budget: ${budget_limit:.2f}[/dim]")
 
     # Output location hint
     has_run_timestamp = ('last_run_timestamp' in status_data and
@@ -400,15 +427,23 @@ def format_status_info(status_data: Dict[str, Any], workflow_filter: str = None,
 
     # Next steps hint
     lines.append("")
-    from ..core.ui.commands import suggest_command
-    if mock_mode:
-        lines.append(f"💡 [dim]Next:[/dim] Run [{get_theme_color('info')}]'{suggest_command('setup')}'[/{get_theme_color('info')}] to configure real AI providers")
-    else:
-        lines.append(f"💡 [dim]Next:[/dim] Run [{get_theme_color('info')}]'{suggest_command('run templates/hello-workflow.yml')}'[/{get_theme_color('info')}] to test AI")
+    lines.append(_NEXT_HINT_MOCK if mock_mode else _NEXT_HINT_REAL)
 
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=1)
+def _security_capabilities() -> tuple:
+    """
+    Probe kernel security capabilities once per process.
+
+    Returns:
+        Tuple of (syscall_filtering_available, sandbox_available)
+    """
+    from ..security.validation import _syscall_filtering_available, _sandbox_available
+    return _syscall_filtering_available(), _sandbox_available()
+
+
 def get_security_status_summary() -> Dict[str, str]:
     """
     Get a concise security status summary for status display.
@@ -417,13 +452,10 @@ def get_security_status_summary() -> Dict[str, str]:
         Dict with security status information
     """
     try:
-        from ..config import get_settings
         settings = get_settings()
 
         # Determine security level
-        from ..security.validation import _syscall_filtering_available, _sandbox_available
-        syscall_available = _syscall_filtering_available()
-        sandbox_available = _sandbox_available()
+        syscall_available, sandbox_available = _security_capabilities()
 
         if syscall_available and sandbox_available:
             level = "Full (Kernel-hard)"
@@ -507,20 +539,41 @@ def format_logs_info(logs_data: Dict[str, Any]) -> str:
     if not events:
         lines.append(f"[{get_theme_color('warning')}]No recent logs found[/{get_theme_color('warning')}]")
     else:
-        for i, event in enumerate(events[-10:], 1):  # Show last 10 events
-            timestamp = event.get("timestamp", "unknown")[:19]  # YYYY-MM-DDTHH:MM:SS
-            agent = event.get("agent", "unknown")
-            action = event.get("action", "unknown")
-            result = event.get("result", "unknown")
-
-            # Color code the result
-            if result == "success":
-                status = f"[bold {get_theme_color('success')}]✓[/bold {get_theme_color('success')}]"
-                result_colored = f"[{get_theme_color('success')}]" + result + f"[/{get_theme_color('success')}]"
-            else:
-                status = f"[bold {get_theme_color('error')}]✗[/bold {get_theme_color('error')}]"
-                result_colored = f"[{get_theme_color('error')}]" + result + f"[/{get_theme_color('error')}]"
-            
-            lines.append(f"{i:2d}: [dim]{timestamp}[/dim] [{get_theme_color('info')}]{agent}[/{get_theme_color('info')}].[{get_theme_color('info')}]{action}[/{get_theme_color('info')}] -> {status} {result_colored}")
+        recent = events[-10:]  # Show last 10 events
+        lines.extend(_format_events(
+            [event.get("timestamp", "unknown")[:19] for event in recent],  # YYYY-MM-DDTHH:MM:SS
+            [event.get("agent", "unknown") for event in recent],
+            [event.get("action", "unknown") for event in recent],
+            [event.get("result", "unknown") for event in recent],
+        ))
 
     return "\n".join(lines)
+
+
+def _format_events(timestamps: List[str], agents: List[str],
+                   actions: List[str], results: List[str]) -> List[str]:
+    """
+    Format log events from pre-extracted parallel columns.
+
+    Theme colors and status glyphs are resolved once per batch rather than
+    once per event, so cost stays linear in the number of events when the
+    log window is widened.
+    """
+    info = get_theme_color('info')
+    success = get_theme_color('success')
+    error = get_theme_color('error')
+    # result -> (status glyph, color); anything other than success is an error
+    glyphs = {
+        True: (f"[bold {success}]✓[/bold {success}]", success),
+        False: (f"[bold {error}]✗[/bold {error}]", error),
+    }
+
+    lines = []
+    for i, (timestamp, agent, action, result) in enumerate(
+            zip(timestamps, agents, actions, results), 1):
+        status, color = glyphs[result == "success"]
+        lines.append(
+            f"{i:2d}: [dim]{timestamp}[/dim] [{info}]{agent}[/{info}].[{info}]{action}[/{info}]"
+            f" -> {status} [{color}]{result}[/{color}]"
+        )
+    return lines
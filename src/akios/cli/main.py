@@ -20,86 +20,74 @@ Simple, script-friendly interface with zero external dependencies.
 """
 
 import argparse
+import functools
 import logging
 import os
+import re
+import subprocess
 import sys
+from typing import Dict, List, Optional
 
-# Handle PyInstaller frozen application
-if getattr(sys, 'frozen', False):
+# Handle PyInstaller frozen application (resolved once; checked again by the
+# startup helpers below, which keep their imports deferred)
+_FROZEN = getattr(sys, 'frozen', False)
+
+if _FROZEN:
     # Running in a PyInstaller bundle
     import akios._version as _version_module
     import akios.cli.commands as commands_module
-    import akios.cli.helpers as helpers_module
 
     __version__ = _version_module.__version__
     register_all_commands = commands_module.register_all_commands
+    register_command = commands_module.register_command
+    is_known_command = commands_module.is_known_command
     get_command_descriptions = commands_module.get_command_descriptions
-    get_version_info = helpers_module.get_version_info
-    handle_cli_error = helpers_module.handle_cli_error
 else:
     # Running as normal Python module
     from .._version import __version__
-    from .commands import register_all_commands, get_command_descriptions
-    from .helpers import get_version_info, handle_cli_error
+    from .commands import (
+        register_all_commands, register_command, is_known_command, get_command_descriptions
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _git_version_suffix() -> str:
+    """
+    Get the commit/build-date suffix for --version from a single git call.
+
+    Returns:
+        Plain text suffix, or an empty string if git is unavailable or the
+        current directory is not a repository.
+    """
+    try:
+        result = subprocess.run(['git', 'log', '-1', '--format=%h|%ci', 'HEAD'],
+                              capture_output=True, text=True, cwd='.', timeout=1.0)
+    except (Exception, KeyboardInterrupt):
+        return ""  # Gracefully ignore if git not available
+
+    commit_hash, sep, commit_date = result.stdout.strip().partition('|')
+    if result.returncode != 0 or not sep:
+        return ""
+
+    build_date = commit_date.split()[0]  # Just the date part
+    return f" (commit: {commit_hash}) (built: {build_date})"
 
 
 def show_version() -> None:
     """Show enhanced version information with build details."""
-    from ..core.ui.rich_output import _should_use_rich
-    
+    from ..core.ui.rich_output import _should_use_rich, _get_console, get_theme_color
+
+    suffix = _git_version_suffix()
+
     if _should_use_rich():
-        from ..core.ui.rich_output import get_theme_color
         version_info = f"[bold {get_theme_color('header')}]AKIOS[/bold {get_theme_color('header')}] [bold]{__version__}[/bold]"
-        try:
-            # Try to get git commit hash
-            import subprocess
-            result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
-                                  capture_output=True, text=True, cwd='.')
-            if result.returncode == 0:
-                commit_hash = result.stdout.strip()
-                version_info += f" [dim](commit: {commit_hash})[/dim]"
-        except (Exception, KeyboardInterrupt):
-            pass  # Gracefully ignore if git not available
-
-        try:
-            # Try to get build date from git
-            import subprocess
-            result = subprocess.run(['git', 'log', '-1', '--format=%ci'],
-                                  capture_output=True, text=True, cwd='.')
-            if result.returncode == 0:
-                build_date = result.stdout.strip().split()[0]  # Just the date part
-                version_info += f" [dim](built: {build_date})[/dim]"
-        except (Exception, KeyboardInterrupt):
-            pass  # Gracefully ignore if git not available
-        
+        if suffix:
+            version_info += f" [dim]{suffix[1:]}[/dim]"
         # Use Rich console for colored output
-        from ..core.ui.rich_output import _get_console
-        console = _get_console()
-        console.print(version_info)
+        _get_console().print(version_info)
     else:
         # Plain text fallback
-        version_info = f"AKIOS {__version__}"
-        try:
-            import subprocess
-            result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
-                                  capture_output=True, text=True, cwd='.')
-            if result.returncode == 0:
-                commit_hash = result.stdout.strip()
-                version_info += f" (commit: {commit_hash})"
-        except (Exception, KeyboardInterrupt):
-            pass
-
-        try:
-            import subprocess
-            result = subprocess.run(['git', 'log', '-1', '--format=%ci'],
-                                  capture_output=True, text=True, cwd='.')
-            if result.returncode == 0:
-                build_date = result.stdout.strip().split()[0]
-                version_info += f" (built: {build_date})"
-        except (Exception, KeyboardInterrupt):
-            pass
-        
-        print(version_info)
+        print(f"AKIOS {__version__}{suffix}")
 
 
 class CustomHelpFormatter(argparse.RawDescriptionHelpFormatter):
@@ -110,6 +98,14 @@ class CustomHelpFormatter(argparse.RawDescriptionHelpFormatter):
     Colors automatically disabled in non-TTY environments.
     """
 
+    _SECTION_RE = re.compile(
+        r'usage:|AKIOS - Security-first AI agent runtime|commands:|options:|Examples:'
+    )
+    # Example lines invoking akios, excluding comment-only lines
+    _EXAMPLE_LINE_RE = re.compile(r'^(?![ \t]*#).*  akios .*$', re.MULTILINE)
+    # Plain help text -> colored help text, shared across formatter instances
+    _colored_help_cache: Dict[str, str] = {}
+
     def _format_usage(self, usage, actions, groups, prefix):
         """Override usage formatting to customize help output."""
         result = super()._format_usage(usage, actions, groups, prefix)
@@ -120,8 +116,17 @@ class CustomHelpFormatter(argparse.RawDescriptionHelpFormatter):
         help_text = super().format_help()
         help_text = help_text.replace('positional arguments:', 'commands:')
         
-        # Add colors if terminal supports it
-        if sys.stdout.isatty() and os.environ.get('NO_COLOR') != '1':
+        # Add colors if terminal supports it; text that already carries escape
+        # sequences (re-rendered fragments) is left alone to avoid double-coloring
+        if ('\x1b[' not in help_text and sys.stdout.isatty()
+                and os.environ.get('NO_COLOR') != '1'):
+            # Theme colors are fixed per process, so the colored text is a
+            # pure function of the plain help text
+            cached = self._colored_help_cache.get(help_text)
+            if cached is not None:
+                return cached
+            plain_text = help_text
+
             from ..core.ui.rich_output import get_theme_ansi, ANSI_RESET
             
             # Semantic Theme Colors
@@ -132,27 +137,28 @@ class CustomHelpFormatter(argparse.RawDescriptionHelpFormatter):
             DIM = "\033[2m"  # Standard ANSI dim style
             RESET = ANSI_RESET
             
-            # Color the main sections
-            help_text = help_text.replace('usage:', f'{INFO_COLOR}usage:{RESET}')
-            help_text = help_text.replace('AKIOS - Security-first AI agent runtime', 
-                                         f'{HEADER_COLOR}AKIOS{RESET} - {DIM}Security-first AI agent runtime{RESET}')
-            help_text = help_text.replace('commands:', f'{SUCCESS_COLOR}commands:{RESET}')
-            help_text = help_text.replace('options:', f'{SUCCESS_COLOR}options:{RESET}')
-            help_text = help_text.replace('Examples:', f'{WARNING_COLOR}Examples:{RESET}')
+            # Color the main sections in a single pass
+            section_colors = {
+                'usage:': f'{INFO_COLOR}usage:{RESET}',
+                'AKIOS - Security-first AI agent runtime':
+                    f'{HEADER_COLOR}AKIOS{RESET} - {DIM}Security-first AI agent runtime{RESET}',
+                'commands:': f'{SUCCESS_COLOR}commands:{RESET}',
+                'options:': f'{SUCCESS_COLOR}options:{RESET}',
+                'Examples:': f'{WARNING_COLOR}Examples:{RESET}',
+            }
+            help_text = self._SECTION_RE.sub(lambda m: section_colors[m.group(0)], help_text)
             
             # Color command names in examples (lines starting with akios)
-            lines = help_text.split('\n')
-            colored_lines = []
-            for line in lines:
-                # Color 'akios' command in examples
-                if '  akios ' in line and not line.strip().startswith('#'):
-                    line = line.replace('akios ', f'{INFO_COLOR}akios{RESET} ')
-                    # Color comments
-                    if '#' in line:
-                        parts = line.split('#', 1)
-                        line = parts[0] + f'{DIM}#{parts[1]}{RESET}'
-                colored_lines.append(line)
-            help_text = '\n'.join(colored_lines)
+            def _color_example(match) -> str:
+                line = match.group(0).replace('akios ', f'{INFO_COLOR}akios{RESET} ')
+                # Color comments
+                code, sep, comment = line.partition('#')
+                if sep:
+                    line = f'{code}{DIM}#{comment}{RESET}'
+                return line
+
+            help_text = self._EXAMPLE_LINE_RE.sub(_color_example, help_text)
+            self._colored_help_cache[plain_text] = help_text
         
         return help_text
 
@@ -162,10 +168,30 @@ class CustomHelpFormatter(argparse.RawDescriptionHelpFormatter):
         return result.replace('positional arguments', 'commands')
 
 
-def create_parser() -> argparse.ArgumentParser:
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """
+    Find the subcommand in argv without building the full parser.
+
+    Global options (--version, --debug, -h) take no values, so the first
+    non-flag token is the command.
+    """
+    for token in argv:
+        if not token.startswith('-'):
+            return token
+    return None
+
+
+def create_parser(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
     """
     Create the main argument parser.
 
+    Only the command named in argv is registered (and its module imported).
+    All commands are registered when help is requested, no command is given,
+    or the command is unknown, so listings and error messages stay complete.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
     Returns:
         Configured ArgumentParser
     """
@@ -204,8 +230,16 @@ Use 'akios <command> --help' for command-specific options.
         metavar="COMMAND"
     )
 
-    # Register all commands
-    register_all_commands(subparsers)
+    if argv is None:
+        argv = sys.argv[1:]
+    command = _sniff_subcommand(argv)
+
+    if is_known_command(command):
+        register_command(subparsers, command)
+    elif command is None and '--version' in argv and not ('-h' in argv or '--help' in argv):
+        pass  # --version alone never dispatches to a command
+    else:
+        register_all_commands(subparsers)
 
     return parser
 
@@ -235,7 +269,7 @@ def _configure_json_mode() -> bool:
 def _validate_startup_security() -> None:
     """Validate security requirements at startup."""
     try:
-        if getattr(sys, 'frozen', False):
+        if _FROZEN:
             import akios.security.validation as validation_module
             validation_module.validate_startup_security()
         else:
@@ -250,7 +284,7 @@ def _validate_configuration(args: argparse.Namespace) -> None:
     """Validate environment configuration early."""
     if args.command not in ['init', 'setup', 'serve']:
         try:
-            if getattr(sys, 'frozen', False):
+            if _FROZEN:
                 import akios.config as config_module
                 config_module.get_settings()
             else:
@@ -267,7 +301,7 @@ def _run_first_run_wizard(args: argparse.Namespace) -> None:
     if args.command == 'init' and getattr(args, 'wizard', False) is True:
         try:
             from pathlib import Path
-            if getattr(sys, 'frozen', False):
+            if _FROZEN:
                 import akios.core.config.first_run as first_run_module
                 first_run_module.run_setup_wizard(Path.cwd())
             else:
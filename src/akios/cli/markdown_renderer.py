@@ -17,18 +17,40 @@ Usage:
     render_markdown_file("README.md")
 """
 
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+from ..core.ui.rich_output import get_theme_color
+
 try:
     from rich.console import Console
     from rich.markdown import Markdown
+    from rich.panel import Panel
     from rich.syntax import Syntax
     RICH_AVAILABLE = True
 except ImportError:
     RICH_AVAILABLE = False
 
+# Non-Markdown documents that are still valid documentation files
+_KNOWN_DOC_FILES = frozenset(('LICENSE', 'NOTICE'))
+_MARKDOWN_EXTENSIONS = ('.md', '.markdown')
+
+# Shared console for the default width (Console() probes the terminal on creation)
+_console = None
+
+
+def _get_console(width: Optional[int] = None) -> "Console":
+    """Return the shared console, or a dedicated one for a width override."""
+    global _console
+    if width:
+        return Console(width=width)
+    if _console is None:
+        _console = Console()
+    return _console
+
 
 def render_markdown(
     markdown_content: str,
@@ -53,7 +75,7 @@ def render_markdown(
         return
     
     try:
-        console = Console(width=width) if width else Console()
+        console = _get_console(width)
         
         # Create Markdown object with Rich
         md = Markdown(
@@ -96,8 +118,7 @@ def render_markdown_file(
     # Handle GitHub fallback for missing files
     if file_path == "Remote (GitHub)":
         if RICH_AVAILABLE and sys.stdout.isatty():
-            from rich.panel import Panel
-            console = Console(width=width) if width else Console()
+            console = _get_console(width)
             console.print(Panel(
                 "[yellow]This document is not available locally.[/yellow]\n\n"
                 "Please view it on GitHub:\n"
@@ -129,13 +150,13 @@ def render_markdown_file(
     # Show file path header
     if show_path:
         if RICH_AVAILABLE and sys.stdout.isatty():
-            from rich.panel import Panel
-            from ..core.ui.rich_output import get_theme_color
-            console = Console(width=width) if width else Console()
+            header_color = get_theme_color('header')
+            bold_header = f"bold {header_color}"
+            console = _get_console(width)
             console.print(Panel(
-                f"📄 [bold {get_theme_color('header')}]{file_path}[/bold {get_theme_color('header')}]",
+                f"📄 [{bold_header}]{file_path}[/{bold_header}]",
                 title="AKIOS Documentation",
-                border_style=get_theme_color("header")
+                border_style=header_color
             ))
             print()  # Spacing
         else:
@@ -172,7 +193,7 @@ def render_code_block(
         return
     
     try:
-        console = Console()
+        console = _get_console()
         syntax = Syntax(
             code,
             language,
@@ -204,7 +225,6 @@ def list_available_themes() -> list:
         return ["monokai"]  # Default
     
     try:
-        from rich.syntax import Syntax
         # Common Rich/Pygments themes
         return [
             "monokai",
@@ -264,24 +284,42 @@ def search_docs(
                 docs_path = alt_path
                 break
     
-    results = []
     query_lower = query.lower()
     
     # Search for .md files
     try:
-        for md_file in docs_path.rglob("*.md"):
-            if query_lower in md_file.name.lower():
-                results.append((str(md_file), md_file.name))
+        return [
+            (file_path, name)
+            for name_lower, name, file_path in _index_docs(str(docs_path))
+            if query_lower in name_lower
+        ]
     except Exception:
-        pass
+        return []
+
+
+@lru_cache(maxsize=4)
+def _index_docs(docs_dir: str) -> list[tuple[str, str, str]]:
+    """
+    Walk docs_dir once and index its Markdown files.
     
-    return results
+    Returns:
+        List of (lowercased name, name, file path) tuples
+    """
+    index = []
+    for root, _dirs, files in os.walk(docs_dir):
+        for name in files:
+            if name.endswith(".md"):
+                index.append((name.lower(), name, os.path.normpath(os.path.join(root, name))))
+    return index
 
 
 def get_doc_paths() -> dict[str, str]:
     """
     Get common documentation paths in AKIOS project.
     
+    Results are cached per working directory, so repeated lookups within a
+    command do not re-stat every candidate file.
+    
     Returns:
         Dict mapping doc names to file paths
     
@@ -290,50 +328,61 @@ def get_doc_paths() -> dict[str, str]:
         >>> "README" in paths
         True
     """
-    common_docs = {
-        "README": "README.md",
-        "SECURITY": "SECURITY.md",
-        "GETTING_STARTED": "GETTING_STARTED.md",
-        "TROUBLESHOOTING": "TROUBLESHOOTING.md",
-        "AGENTS": "AGENTS.md",
-        "ROADMAP": "ROADMAP.md",
-        "CHANGELOG": "CHANGELOG.md",
-        "LEGAL": "LEGAL.md",
-        "LICENSE": "LICENSE",
-        "NOTICE": "NOTICE",
-        "CONTRIBUTING": "CONTRIBUTING.md",
-        "CODE_OF_CONDUCT": "CODE_OF_CONDUCT.md",
-        "DCO": "DCO.md",
-        "GOVERNANCE": "GOVERNANCE.md",
-        "SUPPORT": "SUPPORT.md",
-        "TRADEMARKS": "TRADEMARKS.md",
-        "THIRD_PARTY_LICENSES": "THIRD_PARTY_LICENSES.md",
-    }
-    
-    existing_docs = {}
-    
-    # Check multiple locations for documentation
+    return dict(_get_doc_paths_cached(os.getcwd()))
+
+
+# (doc name, file name) pairs for the common AKIOS documents, in listing order
+_COMMON_DOCS = (
+    ("README", "README.md"),
+    ("SECURITY", "SECURITY.md"),
+    ("GETTING_STARTED", "GETTING_STARTED.md"),
+    ("TROUBLESHOOTING", "TROUBLESHOOTING.md"),
+    ("AGENTS", "AGENTS.md"),
+    ("ROADMAP", "ROADMAP.md"),
+    ("CHANGELOG", "CHANGELOG.md"),
+    ("LEGAL", "LEGAL.md"),
+    ("LICENSE", "LICENSE"),
+    ("NOTICE", "NOTICE"),
+    ("CONTRIBUTING", "CONTRIBUTING.md"),
+    ("CODE_OF_CONDUCT", "CODE_OF_CONDUCT.md"),
+    ("DCO", "DCO.md"),
+    ("GOVERNANCE", "GOVERNANCE.md"),
+    ("SUPPORT", "SUPPORT.md"),
+    ("TRADEMARKS", "TRADEMARKS.md"),
+    ("THIRD_PARTY_LICENSES", "THIRD_PARTY_LICENSES.md"),
+)
+_DOC_NAMES_BY_FILE = {filename: name for name, filename in _COMMON_DOCS}
+
+
+@lru_cache(maxsize=4)
+def _get_doc_paths_cached(cwd: str) -> dict[str, str]:
+    """Resolve documentation paths for a working directory (see get_doc_paths)."""
+    found = {}
+    
+    # Check multiple locations for documentation, in priority order
     # 1. Current directory (user's project)
     # 2. System install location (Docker image)
     # 3. Python package location (pip install)
-    search_paths = [
-        Path("."),
-        Path("/usr/share/akios/legal"),
-        Path(sys.prefix) / "share/akios/legal"
-    ]
-    
-    # Only check current directory (no dependency on package/repo root)
-    for name, filename in common_docs.items():
-        found = False
-        for search_path in search_paths:
-            file_path = search_path / filename
-            if file_path.exists():
-                existing_docs[name] = str(file_path.absolute())
-                found = True
-                break
+    # Each location is listed once with scandir instead of stat'ing every doc
+    search_paths = (
+        cwd,
+        "/usr/share/akios/legal",
+        os.path.join(sys.prefix, "share/akios/legal")
+    )
+    for search_path in search_paths:
+        try:
+            with os.scandir(search_path) as entries:
+                for entry in entries:
+                    name = _DOC_NAMES_BY_FILE.get(entry.name)
+                    if name and name not in found:
+                        found[name] = os.path.abspath(entry.path)
+        except OSError:
+            continue  # Missing or unreadable location
+    
+    existing_docs = {name: found[name] for name, _ in _COMMON_DOCS if name in found}
     
     # If key docs are missing, we still want to list them so we can show the GitHub link
-    for name in common_docs:
+    for name, _ in _COMMON_DOCS:
         if name not in existing_docs:
             existing_docs[name] = "Remote (GitHub)"
             
@@ -362,15 +411,16 @@ def format_markdown_table(
     if not headers or not rows:
         return ""
     
-    # Header row
-    md = "| " + " | ".join(headers) + " |\n"
-    # Separator
-    md += "| " + " | ".join(["---"] * len(headers)) + " |\n"
+    lines = [
+        # Header row
+        "| " + " | ".join(headers) + " |",
+        # Separator
+        "| " + " | ".join(["---"] * len(headers)) + " |",
+    ]
     # Data rows
-    for row in rows:
-        md += "| " + " | ".join(str(cell) for cell in row) + " |\n"
+    lines.extend("| " + " | ".join(str(cell) for cell in row) + " |" for row in rows)
     
-    return md
+    return "\n".join(lines) + "\n"
 
 
 def validate_markdown_file(file_path: str) -> tuple[bool, Optional[str]]:
@@ -397,8 +447,7 @@ def validate_markdown_file(file_path: str) -> tuple[bool, Optional[str]]:
         return False, f"Not a file: {file_path}"
     
     # Allow known non-markdown files like LICENSE/NOTICE or specific extensions
-    known_files = ['LICENSE', 'NOTICE']
-    if path.name not in known_files and not path.suffix.lower() in ['.md', '.markdown']:
+    if path.name not in _KNOWN_DOC_FILES and not path.name.lower().endswith(_MARKDOWN_EXTENSIONS):
         return False, f"Not a Markdown file: {file_path}"
     
     try:
@@ -0,0 +1,41 @@
+# Copyright (C) 2025-2026 AKIOUD AI, SAS <contact@akioud.ai>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Interactive prompt helpers shared by the setup wizard and template picker.
+
+questionary (an optional dependency, with prompt_toolkit underneath it) is
+imported on first use so non-interactive runs never pay for it.
+"""
+
+# None = not tried yet, False = not installed
+_questionary = None
+
+
+def get_questionary():
+    """
+    Import questionary on first use.
+
+    Returns:
+        The questionary module, or None if it is not installed
+    """
+    global _questionary
+    if _questionary is None:
+        try:
+            import questionary
+            _questionary = questionary
+        except ImportError:
+            _questionary = False
+    return _questionary or None
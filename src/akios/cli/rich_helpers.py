@@ -29,18 +29,35 @@ import os
 import re
 import sys
 import json
+from functools import lru_cache
 from typing import Optional, Any, List, Dict
 
+from ..core.utils.fast_json import ORJSON_AVAILABLE, orjson
+
 from ..core.ui.rich_output import (
     print_panel, print_table, print_success, print_warning,
     print_error, print_info, print_banner, is_rich_available
 )
 
 
+# Separator line for plain-text section headers
+_HEADER_SEP = "=" * 60
+
+# Rich markup tags like [bold], [dim], [/#04B1DC], [/]
+_RICH_MARKUP_RE = re.compile(r'\[/?[^\]]*\]')
+
+
+def _strip_rich(text: str) -> str:
+    """Remove Rich markup tags like [bold], [dim], [/#04B1DC], etc."""
+    # Most messages carry no markup at all; skip the regex engine for them
+    return _RICH_MARKUP_RE.sub('', text) if '[' in text else text
+
+
 # ============================================================================
 # OUTPUT MODE DETECTION
 # ============================================================================
 
+@lru_cache(maxsize=1)
 def should_use_rich() -> bool:
     """
     Determine if Rich UI should be used based on environment.
@@ -50,15 +67,18 @@ def should_use_rich() -> bool:
     2. TTY detection (if not a terminal, disable Rich)
     3. Rich library availability
 
+    The result is cached for the process: none of these inputs change once
+    the CLI is running.
+
     Returns:
         True if Rich UI should be used, False otherwise
     """
     # Check NO_COLOR environment variable (standard: https://no-color.org/)
-    if os.environ.get('NO_COLOR'):
+    if _no_color():
         return False
 
     # Check if stdout is a TTY (terminal)
-    if not sys.stdout.isatty():
+    if not stdout_isatty():
         return False
 
     # Check if Rich is available
@@ -68,6 +88,32 @@ def should_use_rich() -> bool:
     return True
 
 
+@lru_cache(maxsize=1)
+def stdout_isatty() -> bool:
+    """Check once whether stdout is a terminal (an isatty() syscall per call otherwise)."""
+    return sys.stdout.isatty()
+
+
+@lru_cache(maxsize=1)
+def _no_color() -> bool:
+    """Check once whether NO_COLOR is set."""
+    return bool(os.environ.get('NO_COLOR'))
+
+
+def reset_output_mode_cache() -> None:
+    """
+    Forget cached output mode decisions.
+
+    For tests or embedders that redirect stdout or change NO_COLOR /
+    AKIOS_JSON_MODE after the first output call.
+    """
+    should_use_rich.cache_clear()
+    stdout_isatty.cache_clear()
+    _no_color.cache_clear()
+    _env_json_mode.cache_clear()
+    _output_mode_summary.cache_clear()
+
+
 def is_json_mode(args_json: bool = False) -> bool:
     """
     Determine if JSON output mode should be used.
@@ -83,6 +129,17 @@ def is_json_mode(args_json: bool = False) -> bool:
     """
     if args_json is True:
         return True
+    return _env_json_mode()
+
+
+@lru_cache(maxsize=1)
+def _env_json_mode() -> bool:
+    """
+    Read AKIOS_JSON_MODE once.
+
+    main.py normalizes the variable to '1'/'0' without changing its truth
+    value, so caching is safe even if the first read happens earlier.
+    """
     return os.environ.get('AKIOS_JSON_MODE', '').lower() in ('1', 'true', 'yes')
 
 
@@ -121,6 +178,7 @@ def output_json_only(data: Any, file=None) -> None:
     Output pure JSON with NO Rich formatting or headers.
 
     Critical for automation: ensures output is parseable by jq and automation tools.
+    Output is indented on a terminal or when AKIOS_JSON_PRETTY=1, compact otherwise.
 
     Args:
         data: Data to output as JSON
@@ -129,12 +187,62 @@ def output_json_only(data: Any, file=None) -> None:
     if file is None:
         file = sys.stdout
 
-    if isinstance(data, dict):
-        json.dump(data, file, indent=2)
-    else:
-        json.dump({"result": data}, file, indent=2)
-    
-    file.write("\n")
+    payload = data if isinstance(data, dict) else {"result": data}
+    pretty = _pretty_json(file)
+    # stdout's TextIOWrapper is bypassed: the payload is encoded once and
+    # written to the underlying binary buffer in a single call
+    buffer = getattr(file, 'buffer', None) if file is sys.stdout else None
+
+    raw = None
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            raw = orjson.dumps(payload, option=option)
+        except TypeError:
+            pass  # Type orjson cannot serialize; use stdlib below
+
+    if raw is None:
+        # Serialize up front: json.dump() issues one write() per token
+        if pretty:
+            text = json.dumps(payload, indent=2) + "\n"
+        else:
+            text = json.dumps(payload, separators=(',', ':')) + "\n"
+        if buffer is None:
+            file.write(text)
+            return
+        raw = text.encode('utf-8')
+
+    if buffer is None:
+        file.write(raw.decode('utf-8'))
+        return
+    file.flush()  # Keep ordering with text already written to stdout
+    buffer.write(raw)
+    buffer.flush()
+
+
+def _pretty_json(file) -> bool:
+    """
+    Decide whether JSON output should be indented.
+
+    Output read by a person (terminal) or explicitly requested via
+    AKIOS_JSON_PRETTY stays indented; piped output for jq/automation is
+    compact.
+    """
+    if os.environ.get('AKIOS_JSON_PRETTY', '').lower() in ('1', 'true', 'yes'):
+        return True
+    isatty = getattr(file, 'isatty', None)
+    return bool(isatty and isatty())
+
+
+# Simple message output types and their Rich printers
+_MESSAGE_PRINTERS = {
+    "success": print_success,
+    "warning": print_warning,
+    "error": print_error,
+    "info": print_info,
+}
 
 
 def output_with_mode(
@@ -166,51 +274,36 @@ def output_with_mode(
         title: Optional title for panel/table output
         style: Optional style/color override
     """
+    if quiet_mode and not json_mode and output_type not in ("error", "warning"):
+        # Quiet mode: suppress info/success messages, keep errors/warnings
+        return
+
     if json_mode:
         # JSON mode: pure JSON output, nothing else
-        json_data = {
+        output_json_only({
             "message": message,
             "type": output_type,
-        }
-        if details:
-            json_data["details"] = details
-        if data:
-            json_data.update(data)
-        output_json_only(json_data)
-        return
-
-    if quiet_mode and output_type not in ["error", "warning"]:
-        # Quiet mode: suppress info/success messages, keep errors/warnings
+            **({"details": details} if details else {}),
+            **(data or {}),
+        })
         return
 
     use_rich = should_use_rich()
 
     if not use_rich:
         # Plain text fallback — strip Rich markup tags
-        def _strip_rich(text: str) -> str:
-            """Remove Rich markup tags like [bold], [dim], [/#04B1DC], etc."""
-            return re.sub(r'\[/?[^\]]*\]', '', text)
-
         if title:
-            print(f"\n{'=' * 60}")
-            print(title)
-            print('=' * 60)
+            print(f"\n{_HEADER_SEP}\n{_strip_rich(title)}\n{_HEADER_SEP}")
         if message:
             print(_strip_rich(message))
         if details:
-            for detail in details:
-                print(f"  {_strip_rich(detail)}")
+            sys.stdout.write("".join(f"  {_strip_rich(detail)}\n" for detail in details))
         return
 
     # Rich UI mode
-    if output_type == "success":
-        print_success(message, details=details) if details else print_success(message)
-    elif output_type == "warning":
-        print_warning(message, details=details) if details else print_warning(message)
-    elif output_type == "error":
-        print_error(message, details=details) if details else print_error(message)
-    elif output_type == "info":
-        print_info(message, details=details) if details else print_info(message)
+    print_fn = _MESSAGE_PRINTERS.get(output_type)
+    if print_fn is not None:
+        print_fn(message, details=details)
     elif output_type == "banner":
         print_banner(title or "Notice", message, style=style)
     elif output_type == "panel":
@@ -352,11 +445,17 @@ def get_output_mode_summary() -> Dict[str, Any]:
     Get current output mode configuration.
 
     Returns:
-        Dict with mode information
+        Dict with mode information (a fresh copy callers may modify)
     """
+    return dict(_output_mode_summary())
+
+
+@lru_cache(maxsize=1)
+def _output_mode_summary() -> Dict[str, Any]:
+    """Build the output mode summary once (see reset_output_mode_cache)."""
     return {
         "rich_available": is_rich_available(),
         "should_use_rich": should_use_rich(),
-        "is_tty": sys.stdout.isatty(),
-        "no_color": bool(os.environ.get('NO_COLOR')),
+        "is_tty": stdout_isatty(),
+        "no_color": _no_color(),
     }
@@ -15,18 +15,34 @@ Features:
 
 import os
 import sys
+from functools import lru_cache
 from typing import Dict, Tuple, Optional
 from enum import Enum
 
-try:
-    import questionary
-    QUESTIONARY_AVAILABLE = True
-except ImportError:
-    QUESTIONARY_AVAILABLE = False
-
 from ..core.ui.rich_output import print_panel, print_success, print_warning, get_theme_color
+from .prompt_helpers import get_questionary
 from .rich_helpers import should_use_rich
 
+# Separator line for plain-text step headers
+_HEADER_SEP = "=" * 60
+
+
+@lru_cache(maxsize=1)
+def _prompt_style():
+    """Build the questionary style shared by all wizard prompts.
+
+    Prompts without a choice list simply never use the highlighted rule.
+
+    Returns:
+        questionary.Style, or None when Rich styling is disabled
+    """
+    if not should_use_rich():
+        return None
+    return get_questionary().Style([
+        ("highlighted", f"fg:{get_theme_color('success')} bold"),
+        ("pointer", f"fg:{get_theme_color('info')} bold"),
+    ])
+
 
 class LLMProvider(str, Enum):
     """Supported LLM providers."""
@@ -39,6 +55,28 @@ class LLMProvider(str, Enum):
     OLLAMA = "ollama"
 
 
+# (menu title, provider) pairs for the provider selection prompt
+_PROVIDER_MENU = (
+    ("OpenAI (GPT-4o, GPT-4o-mini)", LLMProvider.OPENAI),
+    ("Anthropic (Claude)", LLMProvider.ANTHROPIC),
+    ("Grok (xAI)", LLMProvider.GROK),
+    ("Mistral", LLMProvider.MISTRAL),
+    ("Google Gemini", LLMProvider.GEMINI),
+    ("AWS Bedrock (IAM auth)", LLMProvider.BEDROCK),
+    ("Ollama (Local)", LLMProvider.OLLAMA),
+)
+
+
+@lru_cache(maxsize=1)
+def _provider_choices() -> list:
+    """Build the questionary choices for provider selection once."""
+    questionary = get_questionary()
+    return [
+        questionary.Choice(title=title, value=provider.value)
+        for title, provider in _PROVIDER_MENU
+    ]
+
+
 class SetupWizardStep:
     """Represents a single step in the setup wizard."""
 
@@ -66,10 +104,12 @@ class SetupWizardStep:
                 style=get_theme_color("info")
             )
         else:
-            print(f"\n{'='*60}")
-            print(f"Step {self.step_number}/{self.total_steps}: {self.title}")
-            print(f"{'='*60}")
-            print(self.description)
+            print(
+                f"\n{_HEADER_SEP}\n"
+                f"Step {self.step_number}/{self.total_steps}: {self.title}\n"
+                f"{_HEADER_SEP}\n"
+                f"{self.description}"
+            )
 
 
 class InteractiveSetupWizard:
@@ -88,7 +128,7 @@ class InteractiveSetupWizard:
         - TTY is detected (interactive terminal)
         - Not in JSON mode
         """
-        if not QUESTIONARY_AVAILABLE:
+        if get_questionary() is None:
             return False
         if not sys.stdin.isatty():
             return False
@@ -118,22 +158,12 @@ class InteractiveSetupWizard:
             return provider
 
         # Use questionary for interactive selection
+        questionary = get_questionary()
         try:
             provider = questionary.select(
                 "Select LLM provider:",
-                choices=[
-                    questionary.Choice(title="OpenAI (GPT-4o, GPT-4o-mini)", value=LLMProvider.OPENAI.value),
-                    questionary.Choice(title="Anthropic (Claude)", value=LLMProvider.ANTHROPIC.value),
-                    questionary.Choice(title="Grok (xAI)", value=LLMProvider.GROK.value),
-                    questionary.Choice(title="Mistral", value=LLMProvider.MISTRAL.value),
-                    questionary.Choice(title="Google Gemini", value=LLMProvider.GEMINI.value),
-                    questionary.Choice(title="AWS Bedrock (IAM auth)", value=LLMProvider.BEDROCK.value),
-                    questionary.Choice(title="Ollama (Local)", value=LLMProvider.OLLAMA.value),
-                ],
-                style=questionary.Style([
-                    ("highlighted", f"fg:{get_theme_color('success')} bold"),
-                    ("pointer", f"fg:{get_theme_color('info')} bold"),
-                ]) if should_use_rich() else None
+                choices=_provider_choices(),
+                style=_prompt_style()
             ).ask()
 
             if provider is None:  # User pressed ESC/Ctrl+C
@@ -171,12 +201,11 @@ class InteractiveSetupWizard:
             return api_key
 
         # Use questionary for password input (masked)
+        questionary = get_questionary()
         try:
             api_key = questionary.password(
                 f"Enter {provider.upper()} API key:",
-                style=questionary.Style([
-                    ("pointer", f"fg:{get_theme_color('info')} bold"),
-                ]) if should_use_rich() else None
+                style=_prompt_style()
             ).ask()
 
             if api_key is None:  # User pressed ESC/Ctrl+C
@@ -208,27 +237,29 @@ class InteractiveSetupWizard:
         step.display_header()
 
         if not self.is_interactive_available():
+            # Retry warnings are folded into the next prompt so each attempt
+            # is a single write
+            warning = ""
             while True:
                 try:
-                    budget_str = input("\nEnter budget limit ($): ").strip()
+                    budget_str = input(f"{warning}\nEnter budget limit ($): ").strip()
                     budget = float(budget_str)
                     if budget <= 0:
-                        print("⚠️ Budget must be positive")
+                        warning = "⚠️ Budget must be positive\n"
                         continue
                     return budget
                 except ValueError:
-                    print("⚠️ Invalid number format")
+                    warning = "⚠️ Invalid number format\n"
                     continue
 
         # Use questionary for numeric input
+        questionary = get_questionary()
         try:
             budget_str = questionary.text(
                 "Enter budget limit ($):",
                 default="10.00",
                 validate=lambda x: self._validate_budget(x),
-                style=questionary.Style([
-                    ("pointer", f"fg:{get_theme_color('info')} bold"),
-                ]) if should_use_rich() else None
+                style=_prompt_style()
             ).ask()
 
             if budget_str is None:  # User pressed ESC/Ctrl+C
@@ -269,12 +300,13 @@ class InteractiveSetupWizard:
             True if user confirms, False otherwise
         """
         if not self.is_interactive_available():
-            print("\nConfiguration Summary:")
-            for key, value in self.step_history:
-                print(f"  {key}: {value}")
-            confirm = input("\nSave configuration? (yes/no): ").lower().strip()
+            summary = "".join(f"  {key}: {value}\n" for key, value in self.step_history)
+            confirm = input(
+                f"\nConfiguration Summary:\n{summary}\nSave configuration? (yes/no): "
+            ).lower().strip()
             return confirm in ["yes", "y"]
 
+        questionary = get_questionary()
         try:
             summary = "\n".join([
                 f"✓ Provider: {self.config.get('provider', 'not set')}",
@@ -292,10 +324,7 @@ class InteractiveSetupWizard:
             confirm = questionary.confirm(
                 "Save this configuration?",
                 auto_enter=False,
-                style=questionary.Style([
-                    ("pointer", f"fg:{get_theme_color('info')} bold"),
-                    ("highlighted", f"fg:{get_theme_color('success')} bold"),
-                ]) if should_use_rich() else None
+                style=_prompt_style()
             ).ask()
 
             return confirm if confirm is not None else False
@@ -361,7 +390,7 @@ def run_interactive_setup() -> Tuple[bool, Dict[str, any]]:
             api_key = config['api_key']
             budget = config['budget']
     """
-    if not QUESTIONARY_AVAILABLE:
+    if get_questionary() is None:
         print_warning(
             "Interactive mode requires questionary library.\n"
             "Install with: pip install questionary\n"
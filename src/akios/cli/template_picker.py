@@ -23,29 +23,35 @@ Provides interactive selection of workflow templates with:
 - Rich UI formatting
 """
 
+import heapq
 import sys
 from typing import List, Dict, Optional, Tuple
 
-# Try questionary import (optional dependency)
+# Try rapidfuzz import
 try:
-    import questionary
-    from questionary import Choice
-    QUESTIONARY_AVAILABLE = True
+    from rapidfuzz import process as fuzzy_process, fuzz, utils as fuzzy_utils
+    RAPIDFUZZ_AVAILABLE = True
 except ImportError:
-    QUESTIONARY_AVAILABLE = False
-
-# Try fuzzywuzzy import
-try:
-    from fuzzywuzzy import process as fuzzy_process
-    FUZZYWUZZY_AVAILABLE = True
-except ImportError:
-    FUZZYWUZZY_AVAILABLE = False
+    RAPIDFUZZ_AVAILABLE = False
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich import box
 from ..core.ui.rich_output import get_theme_color
+from .prompt_helpers import get_questionary
+
+
+# Shared console for the picker and its error messages
+_console = None
+
+
+def _get_console() -> Console:
+    """Return the shared console, creating it on first use."""
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
 
 
 class TemplatePickerError(Exception):
@@ -80,15 +86,32 @@ class TemplatePicker:
         
         Args:
             templates: List of template dictionaries with 'name' and 'description'
-            enable_search: Enable fuzzy search functionality (requires fuzzywuzzy)
+            enable_search: Enable fuzzy search functionality (requires rapidfuzz)
         """
         if not templates:
             raise TemplatePickerError("No templates available")
         
         self.templates = templates
-        self.enable_search = enable_search and FUZZYWUZZY_AVAILABLE
-        self.console = Console()
+        self.enable_search = enable_search and RAPIDFUZZ_AVAILABLE
+        self._search_corpus = self._build_search_corpus(templates)
+        # Network badge per template, shared by both list renderings
+        self._badges = ["🌐" if t.get("network_required", True) else "💾" for t in templates]
+        self.console = _get_console()
+        
+    @staticmethod
+    def _build_search_corpus(templates: List[Dict[str, str]]) -> List[str]:
+        """
+        Normalize each template's name and description once for searching.
         
+        With rapidfuzz the text gets its full preprocessing (lowercase,
+        punctuation stripped); the substring fallback only needs lowercase.
+        The newline keeps fallback matches from spanning name and description.
+        """
+        texts = (f"{t['name']}\n{t.get('description', '')}" for t in templates)
+        if RAPIDFUZZ_AVAILABLE:
+            return [fuzzy_utils.default_process(text) for text in texts]
+        return [text.lower() for text in texts]
+    
     def is_interactive_available(self) -> bool:
         """
         Check if interactive mode is available.
@@ -96,7 +119,7 @@ class TemplatePicker:
         Returns:
             True if questionary is available and running in a TTY
         """
-        return QUESTIONARY_AVAILABLE and sys.stdin.isatty()
+        return sys.stdin.isatty() and get_questionary() is not None
     
     def run(self) -> Optional[Dict[str, str]]:
         """
@@ -117,19 +140,20 @@ class TemplatePicker:
         Returns:
             Selected template or None if cancelled
         """
+        questionary = get_questionary()
+        
         # Show welcome panel
         self._show_welcome_panel()
         
         # Build choices with descriptions
-        choices = []
-        for template in self.templates:
-            name = template["name"]
-            description = template.get("description", "No description")
-            network_badge = "🌐" if template.get("network_required", True) else "💾"
-            
-            # Format: emoji name - description (truncated)
-            choice_text = f"{network_badge} {name:<30} {description[:60]}"
-            choices.append(Choice(title=choice_text, value=template))
+        # Format: emoji name - description (truncated)
+        choices = [
+            questionary.Choice(
+                title=f"{badge} {template['name']:<30} {template.get('description', 'No description')[:60]}",
+                value=template,
+            )
+            for template, badge in zip(self.templates, self._badges)
+        ]
         
         # Use questionary to select
         try:
@@ -167,11 +191,10 @@ class TemplatePicker:
         self.console.print(f"[{get_theme_color('warning')}]Interactive mode not available. Using fallback.[/{get_theme_color('warning')}]\n")
         
         # Display templates
-        for idx, template in enumerate(self.templates, 1):
+        for idx, (template, badge) in enumerate(zip(self.templates, self._badges), 1):
             name = template["name"]
             description = template.get("description", "No description")
-            network_badge = "🌐" if template.get("network_required", True) else "💾"
-            self.console.print(f"{idx}. {network_badge} {name} - {description}")
+            self.console.print(f"{idx}. {badge} {name} - {description}")
         
         self.console.print(f"\n0. Cancel\n")
         
@@ -192,8 +215,9 @@ class TemplatePicker:
     
     def _show_welcome_panel(self) -> None:
         """Display welcome panel with instructions."""
+        header_color = get_theme_color("header")
         instructions = (
-            f"[bold {get_theme_color('header')}]Template Selector[/bold {get_theme_color('header')}]\n\n"
+            f"[bold {header_color}]Template Selector[/bold {header_color}]\n\n"
             "🔹 Use [bold]↑↓ arrows[/bold] to navigate\n"
             "🔹 Press [bold]Enter[/bold] to select\n"
             "🔹 Press [bold]ESC[/bold] to cancel"
@@ -205,7 +229,7 @@ class TemplatePicker:
         panel = Panel(
             instructions,
             title="[bold]AKIOS Template Picker[/bold]",
-            border_style=get_theme_color("header"),
+            border_style=header_color,
             box=box.ROUNDED
         )
         self.console.print(panel)
@@ -218,6 +242,8 @@ class TemplatePicker:
         Args:
             template: Template dictionary to preview
         """
+        success_color = get_theme_color("success")
+        
         # Create metadata table
         table = Table(show_header=False, box=None, padding=(0, 1))
         table.add_column("Key", style=get_theme_color("info"))
@@ -229,8 +255,8 @@ class TemplatePicker:
         
         panel = Panel(
             table,
-            title=f"[bold {get_theme_color('success')}]✓ Template Selected[/bold {get_theme_color('success')}]",
-            border_style=get_theme_color("success"),
+            title=f"[bold {success_color}]✓ Template Selected[/bold {success_color}]",
+            border_style=success_color,
             box=box.ROUNDED
         )
         self.console.print()
@@ -247,32 +273,47 @@ class TemplatePicker:
         Returns:
             List of matching templates sorted by relevance score
         """
-        if not FUZZYWUZZY_AVAILABLE:
-            # Fallback: simple substring matching
-            return [t for t in self.templates 
-                    if query.lower() in t["name"].lower() 
-                    or query.lower() in t.get("description", "").lower()]
+        # Normalize the query the same way as the corpus
+        if RAPIDFUZZ_AVAILABLE:
+            query = fuzzy_utils.default_process(query)
+        else:
+            query = query.lower()
+        
+        # Nothing typed yet: every template matches equally
+        if not query:
+            return self.templates[:limit]
         
-        # Build searchable strings (name + description)
-        searchable = []
-        for template in self.templates:
-            text = f"{template['name']} {template.get('description', '')}"
-            searchable.append((text, template))
+        # One or two characters carry too little signal for edit distance;
+        # a prefix scan is cheaper and ranks the obvious matches first
+        if len(query) <= 2:
+            prefixed = [t for t, text in zip(self.templates, self._search_corpus)
+                        if text.startswith(query)][:limit]
+            if prefixed:
+                return prefixed
         
-        # Perform fuzzy matching
-        choices = [text for text, _ in searchable]
-        matches = fuzzy_process.extract(query, choices, limit=limit)
+        if not RAPIDFUZZ_AVAILABLE:
+            # Fallback: substring matching, earliest occurrence first; only the
+            # top `limit` hits are kept instead of sorting every match
+            hits = []
+            prefix_hits = 0
+            for idx, text in enumerate(self._search_corpus):
+                pos = text.find(query)
+                if pos == -1:
+                    continue
+                hits.append((pos, idx))
+                if pos == 0:
+                    prefix_hits += 1
+                    # Nothing later can outrank `limit` prefix matches
+                    if prefix_hits == limit:
+                        break
+            return [self.templates[idx] for _, idx in heapq.nsmallest(limit, hits)]
         
-        # Extract templates from matches (matches are tuples of (text, score))
-        result_templates = []
-        for match_text, score in matches:
-            # Find the template corresponding to this match
-            for text, template in searchable:
-                if text == match_text:
-                    result_templates.append(template)
-                    break
+        # Perform fuzzy matching (WRatio) against the preprocessed corpus
+        matches = fuzzy_process.extract(query, self._search_corpus,
+                                        scorer=fuzz.WRatio, processor=None, limit=limit)
         
-        return result_templates
+        # Matches are (text, score, index) tuples; index maps straight back to the template
+        return [self.templates[idx] for _, _, idx in matches]
 
 
 def run_template_picker(templates: List[Dict[str, str]], 
@@ -297,10 +338,10 @@ def run_template_picker(templates: List[Dict[str, str]],
         picker = TemplatePicker(templates, enable_search=enable_search)
         return picker.run()
     except TemplatePickerError as e:
-        console = Console()
+        console = _get_console()
         console.print(f"[{get_theme_color('error')}]Error: {e}[/{get_theme_color('error')}]")
         return None
     except Exception as e:
-        console = Console()
+        console = _get_console()
         console.print(f"[{get_theme_color('error')}]Unexpected error in template picker: {e}[/{get_theme_color('error')}]")
         return None
@@ -5,12 +5,16 @@ Beautiful ASCII timeline visualization of workflow execution.
 Shows per-step duration, bottlenecks, and performance analysis.
 """
 
+import mmap
+import os
 import sys
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import json
 
+from ..core.utils.fast_json import ORJSON_AVAILABLE, orjson
+
 try:
     from rich.console import Console
     from rich.table import Table
@@ -21,9 +25,13 @@ except ImportError:
     RICH_AVAILABLE = False
 
 from ..core.ui.rich_output import get_theme_color
+from .rich_helpers import stdout_isatty
 
+# __slots__ dataclasses need Python 3.10+; older interpreters keep __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class TimelineStep:
     """Represents a workflow step in timeline."""
     name: str
@@ -34,23 +42,114 @@ class TimelineStep:
     index: int = 0
 
 
-def parse_audit_event(audit_data: Dict) -> Tuple[str, float, List[TimelineStep]]:
+# Shared stdout console, created on first Rich render
+_console = None
+
+
+def _get_console(width: Optional[int] = None) -> "Console":
+    """Return the shared console, or a dedicated one for a width override."""
+    global _console
+    if width:
+        return Console(width=width)
+    if _console is None:
+        _console = Console()
+    return _console
+
+
+# Width of the per-step duration bar in the Rich timeline
+_BAR_WIDTH = 25
+
+# Every possible bar of that width, indexed by the number of filled cells
+_BARS = tuple("█" * filled + "░" * (_BAR_WIDTH - filled) for filled in range(_BAR_WIDTH + 1))
+
+# Connector printed between consecutive steps, under the bar column
+_STEP_ARROW = " " * 30 + "↓"
+
+
+@dataclass
+class TimelineStats:
+    """Parsed timeline with the statistics gathered while parsing."""
+    workflow: str
+    total_duration: float
+    steps: List[TimelineStep]
+    bottleneck_index: Optional[int] = None
+    min_duration: float = 0.0
+    max_duration: float = 0.0
+    sum_duration: float = 0.0
+    
+    @property
+    def bottleneck(self) -> Optional[TimelineStep]:
+        """Step with the longest duration (first one on ties), or None."""
+        if self.bottleneck_index is None:
+            return None
+        return self.steps[self.bottleneck_index]
+
+
+def _json_loads(raw: bytes):
+    """Parse JSON bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Audit files at least this large are memory-mapped rather than read()
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _load_audit_file(file_path: str):
     """
-    Parse audit event to extract timeline data.
+    Load an audit JSON file.
+    
+    Large files are memory-mapped and parsed by orjson straight from the
+    mapping, avoiding a second in-memory copy of the file. Small files,
+    or any mapping failure, use a plain read.
+    """
+    with open(file_path, 'rb') as f:
+        mapped = None
+        if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass  # Not mappable (pipe, special file); read it instead
+        if mapped is None:
+            return _json_loads(f.read())
+        with mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+def _json_dumps_pretty(data) -> str:
+    """Serialize to indented JSON, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            pass  # Type orjson cannot serialize; use stdlib below
+    return json.dumps(data, indent=2)
+
+
+def parse_timeline(audit_data: Dict) -> TimelineStats:
+    """
+    Parse audit event into timeline steps and their statistics.
+    
+    Bottleneck, min/max and total step duration are tracked in the same
+    pass that builds the steps, so renderers never re-scan the list.
     
     Args:
         audit_data: Audit event dictionary
     
     Returns:
-        Tuple of (workflow_name, total_duration, steps_list)
+        TimelineStats for the workflow run
     """
-    workflow_name = audit_data.get("workflow", "Unknown")
-    total_duration = audit_data.get("total_duration", 0.0)
-    
-    steps = []
-    step_data = audit_data.get("steps", [])
-    
-    for idx, step in enumerate(step_data, 1):
+    stats = TimelineStats(
+        workflow=audit_data.get("workflow", "Unknown"),
+        total_duration=audit_data.get("total_duration", 0.0),
+        steps=[],
+    )
+    steps = stats.steps
+    sum_duration = 0
+    min_duration = max_duration = None
+    
+    for idx, step in enumerate(audit_data.get("steps", []), 1):
         timeline_step = TimelineStep(
             name=step.get("name", f"Step {idx}"),
             duration=step.get("duration", 0.0),
@@ -60,8 +159,51 @@ def parse_audit_event(audit_data: Dict) -> Tuple[str, float, List[TimelineStep]]
             index=idx
         )
         steps.append(timeline_step)
+        
+        duration = timeline_step.duration
+        sum_duration += duration
+        if max_duration is None or duration > max_duration:
+            max_duration = duration
+            stats.bottleneck_index = idx - 1
+        if min_duration is None or duration < min_duration:
+            min_duration = duration
     
-    return workflow_name, total_duration, steps
+    if steps:
+        stats.min_duration = min_duration
+        stats.max_duration = max_duration
+        stats.sum_duration = sum_duration
+    return stats
+
+
+def parse_audit_event(audit_data: Dict) -> Tuple[str, float, List[TimelineStep]]:
+    """
+    Parse audit event to extract timeline data.
+    
+    Args:
+        audit_data: Audit event dictionary
+    
+    Returns:
+        Tuple of (workflow_name, total_duration, steps_list)
+    """
+    stats = parse_timeline(audit_data)
+    return stats.workflow, stats.total_duration, stats.steps
+
+
+def _audit_shallow(audit_data: Dict) -> Tuple[str, float, int]:
+    """
+    Read the run-level fields needed for comparisons.
+    
+    Comparisons only show the step count, so no TimelineStep objects are
+    built.
+    
+    Returns:
+        Tuple of (workflow_name, total_duration, step_count)
+    """
+    return (
+        audit_data.get("workflow", "Unknown"),
+        audit_data.get("total_duration", 0.0),
+        len(audit_data.get("steps", ())),
+    )
 
 
 def calculate_bottleneck(steps: List[TimelineStep]) -> Optional[TimelineStep]:
@@ -92,7 +234,9 @@ def format_percentage(duration: float, total: float) -> str:
     """
     if total == 0:
         return "0%"
-    return f"{(duration / total) * 100:.0f}%"
+    # round() gives the same half-to-even result as the ".0f" format spec
+    # while skipping format-spec parsing on this per-step call
+    return f"{round((duration / total) * 100)}%"
 
 
 def create_duration_bar(
@@ -122,6 +266,18 @@ def create_duration_bar(
     return "█" * filled + "░" * empty
 
 
+def _create_duration_bar_fast(duration: float, width_over_total: float) -> str:
+    """
+    Variant of create_duration_bar for the Rich render loop (_BAR_WIDTH wide).
+    
+    The caller computes _BAR_WIDTH / total once (0 when total is 0), and
+    the bar itself is a lookup into the prebuilt _BARS table.
+    """
+    if not width_over_total:
+        return _BARS[0]
+    return _BARS[min(_BAR_WIDTH, max(1, int(duration * width_over_total)))]
+
+
 def render_timeline(
     audit_data: Dict,
     json_mode: bool = False,
@@ -139,7 +295,7 @@ def render_timeline(
         _render_timeline_json(audit_data)
         return
     
-    if not RICH_AVAILABLE or not sys.stdout.isatty():
+    if not RICH_AVAILABLE or not stdout_isatty():
         _render_timeline_plain(audit_data)
         return
     
@@ -148,15 +304,24 @@ def render_timeline(
 
 def _render_timeline_rich(audit_data: Dict, width: Optional[int] = None) -> None:
     """Render timeline with Rich styling."""
-    console = Console(width=width) if width else Console()
+    console = _get_console(width)
     
-    workflow_name, total_duration, steps = parse_audit_event(audit_data)
+    stats = parse_timeline(audit_data)
+    workflow_name, total_duration, steps = stats.workflow, stats.total_duration, stats.steps
     
     if not steps:
-        console.print(f"[{get_theme_color('warning')}]No steps found in audit data[/{get_theme_color('warning')}]")
+        warning_color = get_theme_color('warning')
+        console.print(f"[{warning_color}]No steps found in audit data[/{warning_color}]")
         return
     
-    bottleneck = calculate_bottleneck(steps)
+    # Resolve theme colors once rather than per step
+    header_color = get_theme_color("header")
+    success_color = get_theme_color("success")
+    error_color = get_theme_color("error")
+    slowest_tag = f" [bold {error_color}]← SLOWEST[/bold {error_color}]"
+    bar_scale = _BAR_WIDTH / total_duration if total_duration else 0
+    
+    bottleneck = stats.bottleneck
     
     # Header panel
     header_text = f"Workflow: {workflow_name}"
@@ -164,25 +329,27 @@ def _render_timeline_rich(audit_data: Dict, width: Optional[int] = None) -> None
         header_text += f" | Completed: {audit_data['end_time']}"
     header_text += f" | Total: [bold]{total_duration:.2f}s[/bold]"
     
-    console.print(Panel(header_text, style=get_theme_color("header"), expand=False))
+    # Everything is collected and printed in one call: a single markup pass
+    # and write instead of two console.print() calls per step
+    renderables = [Panel(header_text, style=header_color, expand=False)]
     
     # Timeline section
-    console.print(f"\n[bold {get_theme_color('header')}]Timeline (Execution Order):[/bold {get_theme_color('header')}]\n")
+    renderables.append(f"\n[bold {header_color}]Timeline (Execution Order):[/bold {header_color}]\n")
     
     for i, step in enumerate(steps):
         # Status indicator
         status_icon = "✓" if step.status == "success" else "✗"
-        status_color = get_theme_color("success") if step.status == "success" else get_theme_color("error")
+        status_color = success_color if step.status == "success" else error_color
         
         # Progress bar
-        bar = create_duration_bar(step.duration, total_duration, width=25)
+        bar = _create_duration_bar_fast(step.duration, bar_scale)
         
         # Percentage
         pct = format_percentage(step.duration, total_duration)
         
         # Highlight bottleneck
-        is_bottleneck = step == bottleneck
-        slowest_marker = f" [bold {get_theme_color('error')}]← SLOWEST[/bold {get_theme_color('error')}]" if is_bottleneck else ""
+        is_bottleneck = step is bottleneck
+        slowest_marker = slowest_tag if is_bottleneck else ""
         
         # Step line
         step_line = (
@@ -190,17 +357,17 @@ def _render_timeline_rich(audit_data: Dict, width: Optional[int] = None) -> None
             f"{i+1:2d}. [bold]{step.name:<25}[/bold] "
             f"[{bar}] {step.duration:.2f}s ({pct}){slowest_marker}"
         )
-        console.print(step_line)
+        renderables.append(step_line)
         
         # Arrow between steps
         if i < len(steps) - 1:
-            console.print("     " + " " * 25 + "↓")
+            renderables.append(_STEP_ARROW)
     
     # Bottleneck analysis
     if bottleneck:
         pct = format_percentage(bottleneck.duration, total_duration)
-        console.print(f"\n[yellow]💡 Bottleneck:[/yellow] [bold]{bottleneck.name}[/bold] "
-                     f"({pct} of total time)")
+        renderables.append(f"\n[yellow]💡 Bottleneck:[/yellow] [bold]{bottleneck.name}[/bold] "
+                           f"({pct} of total time)")
         
         # Optimization suggestion
         if bottleneck.name.lower().startswith("call"):
@@ -212,38 +379,47 @@ def _render_timeline_rich(audit_data: Dict, width: Optional[int] = None) -> None
         else:
             suggestion = "Profile this step to identify optimization opportunities"
         
-        console.print(f"[cyan]→ Suggestion:[/cyan] {suggestion}")
+        renderables.append(f"[cyan]→ Suggestion:[/cyan] {suggestion}")
+    
+    console.print(*renderables, sep="\n")
 
 
 def _render_timeline_plain(audit_data: Dict) -> None:
     """Render timeline as plain text (fallback)."""
-    workflow_name, total_duration, steps = parse_audit_event(audit_data)
+    stats = parse_timeline(audit_data)
+    workflow_name, total_duration, steps = stats.workflow, stats.total_duration, stats.steps
     
     if not steps:
         print("No steps found in audit data")
         return
     
-    bottleneck = calculate_bottleneck(steps)
-    
-    print(f"\nWorkflow: {workflow_name}")
-    print(f"Total: {total_duration:.2f}s")
-    print("\nTimeline (Execution Order):\n")
-    
-    for i, step in enumerate(steps, 1):
-        pct = format_percentage(step.duration, total_duration)
-        status = "✓" if step.status == "success" else "✗"
-        slowest = " (SLOWEST)" if step == bottleneck else ""
-        print(f"{status} {i}. {step.name:<25} {step.duration:.2f}s ({pct}){slowest}")
+    bottleneck = stats.bottleneck
+    
+    # Build the whole report and write it once instead of one print per step
+    rows = [
+        f"\nWorkflow: {workflow_name}",
+        f"Total: {total_duration:.2f}s",
+        "\nTimeline (Execution Order):\n",
+    ]
+    rows.extend(
+        f"{'✓' if step.status == 'success' else '✗'} {i}. {step.name:<25} "
+        f"{step.duration:.2f}s ({format_percentage(step.duration, total_duration)})"
+        f"{' (SLOWEST)' if step is bottleneck else ''}"
+        for i, step in enumerate(steps, 1)
+    )
     
     if bottleneck:
         pct = format_percentage(bottleneck.duration, total_duration)
-        print(f"\nBottleneck: {bottleneck.name} ({pct} of total time)")
+        rows.append(f"\nBottleneck: {bottleneck.name} ({pct} of total time)")
+    
+    sys.stdout.write("\n".join(rows) + "\n")
 
 
 def _render_timeline_json(audit_data: Dict) -> None:
     """Render timeline as JSON."""
-    workflow_name, total_duration, steps = parse_audit_event(audit_data)
-    bottleneck = calculate_bottleneck(steps)
+    stats = parse_timeline(audit_data)
+    workflow_name, total_duration, steps = stats.workflow, stats.total_duration, stats.steps
+    bottleneck = stats.bottleneck
     
     output = {
         "workflow": workflow_name,
@@ -255,7 +431,7 @@ def _render_timeline_json(audit_data: Dict) -> None:
                 "duration": step.duration,
                 "percentage": (step.duration / total_duration * 100) if total_duration > 0 else 0,
                 "status": step.status,
-                "is_bottleneck": step == bottleneck
+                "is_bottleneck": step is bottleneck
             }
             for step in steps
         ],
@@ -266,7 +442,7 @@ def _render_timeline_json(audit_data: Dict) -> None:
         } if bottleneck else None
     }
     
-    print(json.dumps(output, indent=2))
+    print(_json_dumps_pretty(output))
 
 
 def render_timeline_file(
@@ -286,8 +462,7 @@ def render_timeline_file(
         True on success, False on error
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            audit_data = json.load(f)
+        audit_data = _load_audit_file(file_path)
         
         render_timeline(audit_data, json_mode=json_mode, width=width)
         return True
@@ -320,17 +495,17 @@ def compare_timelines(
     if json_mode:
         comparisons = []
         for audit_data in audit_data_list:
-            workflow, total_duration, steps = parse_audit_event(audit_data)
+            workflow, total_duration, step_count = _audit_shallow(audit_data)
             comparisons.append({
                 "workflow": workflow,
                 "total_duration": total_duration,
-                "step_count": len(steps),
+                "step_count": step_count,
                 "timestamp": audit_data.get("end_time")
             })
-        print(json.dumps(comparisons, indent=2))
+        print(_json_dumps_pretty(comparisons))
         return
     
-    if not RICH_AVAILABLE or not sys.stdout.isatty():
+    if not RICH_AVAILABLE or not stdout_isatty():
         _compare_timelines_plain(audit_data_list)
         return
     
@@ -341,13 +516,13 @@ def _compare_timelines_plain(audit_data_list: List[Dict]) -> None:
     """Compare timelines as plain text."""
     print("\nWorkflow Comparison:\n")
     for i, audit_data in enumerate(audit_data_list, 1):
-        workflow, total_duration, steps = parse_audit_event(audit_data)
-        print(f"Run {i}: {workflow} - {total_duration:.2f}s ({len(steps)} steps)")
+        workflow, total_duration, step_count = _audit_shallow(audit_data)
+        print(f"Run {i}: {workflow} - {total_duration:.2f}s ({step_count} steps)")
 
 
 def _compare_timelines_rich(audit_data_list: List[Dict]) -> None:
     """Compare timelines with Rich styling."""
-    console = Console()
+    console = _get_console()
     
     # Create comparison table
     table = Table(title="Workflow Timeline Comparison")
@@ -358,14 +533,14 @@ def _compare_timelines_rich(audit_data_list: List[Dict]) -> None:
     table.add_column("Timestamp", style=get_theme_color("info"))
     
     for i, audit_data in enumerate(audit_data_list, 1):
-        workflow, total_duration, steps = parse_audit_event(audit_data)
+        workflow, total_duration, step_count = _audit_shallow(audit_data)
         timestamp = audit_data.get("end_time", "Unknown")
         
         table.add_row(
             str(i),
             workflow,
             f"{total_duration:.2f}s",
-            str(len(steps)),
+            str(step_count),
             timestamp
         )
     
@@ -382,24 +557,24 @@ def get_timeline_summary(audit_data: Dict) -> Dict:
     Returns:
         Summary dictionary with statistics
     """
-    workflow_name, total_duration, steps = parse_audit_event(audit_data)
-    bottleneck = calculate_bottleneck(steps)
+    stats = parse_timeline(audit_data)
+    bottleneck = stats.bottleneck
     
-    if not steps:
+    if not stats.steps:
         return {
-            "workflow": workflow_name,
+            "workflow": stats.workflow,
             "total_duration": 0,
             "step_count": 0
         }
     
-    durations = [s.duration for s in steps]
+    total_duration = stats.total_duration
     return {
-        "workflow": workflow_name,
+        "workflow": stats.workflow,
         "total_duration": total_duration,
-        "step_count": len(steps),
-        "average_step_duration": sum(durations) / len(durations),
-        "min_step_duration": min(durations),
-        "max_step_duration": max(durations),
+        "step_count": len(stats.steps),
+        "average_step_duration": stats.sum_duration / len(stats.steps),
+        "min_step_duration": stats.min_duration,
+        "max_step_duration": stats.max_duration,
         "bottleneck_step": bottleneck.name if bottleneck else None,
         "bottleneck_duration": bottleneck.duration if bottleneck else None,
         "bottleneck_percentage": (bottleneck.duration / total_duration * 100) if bottleneck and total_duration > 0 else 0
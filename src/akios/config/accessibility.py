@@ -21,7 +21,8 @@ Usage:
 """
 
 import os
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Optional, Dict, Tuple
 from enum import Enum
 
 # Symbol modes
@@ -33,8 +34,14 @@ class SymbolMode(Enum):
     GRAPHICAL = "graphical"  # ✓/✗/⚠/ℹ - Traditional graphical characters
 
 
-# Global symbol mode
+# Mode string -> SymbolMode, and the mode names in definition order
+_MODE_BY_STR: Dict[str, SymbolMode] = {m.value: m for m in SymbolMode}
+_SYMBOL_MODE_NAMES = tuple(_MODE_BY_STR)
+
+
+# Global symbol mode (and its string value, read on every get_symbol call)
 _symbol_mode: Optional[SymbolMode] = None
+_symbol_mode_str: Optional[str] = None
 
 
 def set_symbol_mode(mode: str) -> bool:
@@ -53,24 +60,25 @@ def set_symbol_mode(mode: str) -> bool:
         >>> get_symbol("success")
         '●'
     """
-    global _symbol_mode
+    global _symbol_mode, _symbol_mode_str
     
     if mode == "none" or mode is None:
         _symbol_mode = None
+        _symbol_mode_str = None
         return True
     
-    try:
-        _symbol_mode = SymbolMode(mode)
-        return True
-    except ValueError:
+    mode_enum = mode if isinstance(mode, SymbolMode) else _MODE_BY_STR.get(mode)
+    if mode_enum is None:
         return False
+    
+    _symbol_mode = mode_enum
+    _symbol_mode_str = mode_enum.value
+    return True
 
 
 def get_symbol_mode() -> Optional[str]:
     """Get current symbol mode ("unicode", "ascii", "text", "graphical", or None)."""
-    if _symbol_mode is None:
-        return None
-    return _symbol_mode.value
+    return _symbol_mode_str
 
 
 def should_use_symbols() -> bool:
@@ -101,63 +109,39 @@ def resolve_symbol_mode_from_env() -> Optional[str]:
     return os.environ.get("AKIOS_SYMBOL_MODE")
 
 
-# Symbol definitions for each mode
+# Semantic symbol types, in the column order of _MODE_VALUES
+_SEMANTIC_TYPES: Tuple[str, ...] = (
+    "success", "error", "warning", "info", "checkmark",
+    "cross", "arrow_right", "arrow_down", "bullet", "loading",
+)
+
+# Symbol definitions for each mode, one value per semantic type
+_MODE_VALUES: Dict[str, Tuple[str, ...]] = {
+    # Unicode symbols - Clean, modern, shape-based
+    # (blue circle, magenta square, yellow triangle, cyan diamond, ...)
+    "unicode": ("●", "□", "△", "◆", "✓", "✗", "→", "↓", "•", "⟳"),
+    # ASCII-safe symbols - Maximum compatibility
+    "ascii": ("+", "-", "!", "?", "+", "-", "->", "|", "*", "*"),
+    # Text-based badges - Maximum clarity
+    "text": ("[OK]", "[ERR]", "[WARN]", "[INFO]", "[✓]", "[✗]", ">>>", "v", "---", "..."),
+    # Traditional graphical characters (original)
+    "graphical": ("✓", "✗", "⚠", "ℹ", "✓", "✗", "→", "↓", "◆", "⟳"),
+}
+
+
+# Public view of the table above: mode -> {semantic_type: symbol}.
+# Derived from _MODE_VALUES at import; get_symbol() reads _FLAT_SYMBOLS below,
+# so new or changed symbols belong in _MODE_VALUES.
 SYMBOLS: Dict[str, Dict[str, str]] = {
-    "unicode": {
-        # Unicode symbols - Clean, modern, shape-based
-        "success": "●",          # Blue circle
-        "error": "□",            # Magenta square
-        "warning": "△",          # Yellow triangle
-        "info": "◆",             # Cyan diamond
-        "checkmark": "✓",        # Generic checkmark
-        "cross": "✗",            # Generic X
-        "arrow_right": "→",
-        "arrow_down": "↓",
-        "bullet": "•",
-        "loading": "⟳",
-    },
-    
-    "ascii": {
-        # ASCII-safe symbols - Maximum compatibility
-        "success": "+",          # Plus sign
-        "error": "-",            # Minus/dash
-        "warning": "!",          # Exclamation
-        "info": "?",             # Question mark
-        "checkmark": "+",
-        "cross": "-",
-        "arrow_right": "->",
-        "arrow_down": "|",
-        "bullet": "*",
-        "loading": "*",
-    },
-    
-    "text": {
-        # Text-based badges - Maximum clarity
-        "success": "[OK]",
-        "error": "[ERR]",
-        "warning": "[WARN]",
-        "info": "[INFO]",
-        "checkmark": "[✓]",
-        "cross": "[✗]",
-        "arrow_right": ">>>",
-        "arrow_down": "v",
-        "bullet": "---",
-        "loading": "...",
-    },
-    
-    "graphical": {
-        # Traditional graphical characters (original)
-        "success": "✓",          # Checkmark
-        "error": "✗",            # X mark
-        "warning": "⚠",          # Warning triangle
-        "info": "ℹ",             # Info symbol
-        "checkmark": "✓",
-        "cross": "✗",
-        "arrow_right": "→",
-        "arrow_down": "↓",
-        "bullet": "◆",
-        "loading": "⟳",
-    },
+    mode: dict(zip(_SEMANTIC_TYPES, values)) for mode, values in _MODE_VALUES.items()
+}
+
+
+# (mode, semantic_type) -> symbol, so get_symbol needs a single lookup
+_FLAT_SYMBOLS: Dict[Tuple[str, str], str] = {
+    (mode, semantic_type): symbol
+    for mode, values in _MODE_VALUES.items()
+    for semantic_type, symbol in zip(_SEMANTIC_TYPES, values)
 }
 
 
@@ -188,15 +172,13 @@ def get_symbol(
     """
     # Use provided mode or current mode
     if mode is None:
-        mode = get_symbol_mode()
+        mode = _symbol_mode_str
     
     # If no mode, return fallback
     if mode is None:
         return fallback
     
-    # Get symbol for mode
-    mode_symbols = SYMBOLS.get(mode, {})
-    return mode_symbols.get(semantic_type, fallback)
+    return _FLAT_SYMBOLS.get((mode, semantic_type), fallback)
 
 
 def get_all_symbols(mode: str) -> Dict[str, str]:
@@ -207,14 +189,14 @@ def get_all_symbols(mode: str) -> Dict[str, str]:
         mode: Symbol mode ("unicode", "ascii", "text", "graphical")
     
     Returns:
-        Dictionary of semantic_type -> symbol
+        Dictionary of semantic_type -> symbol (empty for an unknown mode)
     """
     return SYMBOLS.get(mode, {})
 
 
 def list_symbol_modes() -> list[str]:
     """List all available symbol modes."""
-    return [mode.value for mode in SymbolMode]
+    return list(_SYMBOL_MODE_NAMES)
 
 
 def validate_symbol_type(symbol_type: str) -> bool:
@@ -227,13 +209,41 @@ def validate_symbol_type(symbol_type: str) -> bool:
     Returns:
         True if type exists in at least one mode
     """
-    for mode_symbols in SYMBOLS.values():
-        if symbol_type in mode_symbols:
-            return True
-    return False
+    # Every mode defines the same semantic types
+    return symbol_type in _SEMANTIC_TYPES
 
 
 # Accessibility metadata and scoring
+
+# Simplified relative luminance of common color names (keys are lowercase)
+_LUMINANCE_MAP: Dict[str, float] = {
+    "black": 0.0,
+    "dark_red": 0.1,
+    "dark_green": 0.15,
+    "dark_blue": 0.1,
+    "red": 0.3,
+    "green": 0.5,
+    "yellow": 0.9,
+    "blue": 0.2,
+    "cyan": 0.7,
+    "white": 1.0,
+    "bright_red": 0.5,
+    "bright_green": 0.7,
+    "bright_yellow": 0.95,
+    "bright_cyan": 0.85,
+    "bright_white": 1.0,
+    "dim": 0.2,
+}
+
+# Minimum contrast ratio per WCAG level
+_WCAG_LEVELS: Dict[str, float] = {
+    "A": 3.0,
+    "AA": 4.5,
+    "AAA": 7.0,
+}
+
+
+@lru_cache(maxsize=256)
 def get_contrast_ratio(foreground: str, background: str) -> float:
     """
     Calculate approximate WCAG contrast ratio for colors.
@@ -250,31 +260,14 @@ def get_contrast_ratio(foreground: str, background: str) -> float:
         actual hex color values and precise luminance calculation.
     """
     # Simplified contrast lookup for common colors
-    luminance_map = {
-        "black": 0.0,
-        "dark_red": 0.1,
-        "dark_green": 0.15,
-        "dark_blue": 0.1,
-        "red": 0.3,
-        "green": 0.5,
-        "yellow": 0.9,
-        "blue": 0.2,
-        "cyan": 0.7,
-        "white": 1.0,
-        "bright_red": 0.5,
-        "bright_green": 0.7,
-        "bright_yellow": 0.95,
-        "bright_cyan": 0.85,
-        "bright_white": 1.0,
-        "dim": 0.2,
-    }
-    
-    fg_lum = luminance_map.get(foreground.lower(), 0.5)
-    bg_lum = luminance_map.get(background.lower(), 0.0)
+    fg_lum = _LUMINANCE_MAP.get(foreground.lower(), 0.5)
+    bg_lum = _LUMINANCE_MAP.get(background.lower(), 0.0)
     
     # Simplified WCAG ratio calculation
-    lighter = max(fg_lum, bg_lum)
-    darker = min(fg_lum, bg_lum)
+    if fg_lum >= bg_lum:
+        lighter, darker = fg_lum, bg_lum
+    else:
+        lighter, darker = bg_lum, fg_lum
     
     if darker == 0:
         return lighter * 21.0
@@ -282,6 +275,7 @@ def get_contrast_ratio(foreground: str, background: str) -> float:
     return (lighter + 0.05) / (darker + 0.05)
 
 
+@lru_cache(maxsize=128)
 def check_wcag_compliance(
     foreground: str,
     background: str = "black",
@@ -304,13 +298,7 @@ def check_wcag_compliance(
     """
     ratio = get_contrast_ratio(foreground, background)
     
-    wcag_levels = {
-        "A": 3.0,
-        "AA": 4.5,
-        "AAA": 7.0,
-    }
-    
-    min_ratio = wcag_levels.get(level, 4.5)
+    min_ratio = _WCAG_LEVELS.get(level, 4.5)
     return ratio >= min_ratio
 
 
@@ -330,8 +318,6 @@ def get_accessibility_score(theme_name: str) -> float:
     - 6-8: Good (mostly accessible)
     - 9-10: Excellent (accessible, colorblind-safe, high-contrast)
     """
-    from .themes import THEMES, get_theme_color
-    
     scores = {
         "default": 7.0,          # Good basic colors, some colorblind issues
         "dark": 7.0,             # High contrast, some colorblind issues
@@ -20,6 +20,8 @@ Fixed values that should not be user-configurable.
 Separated from defaults.py for better organization.
 """
 
+import re
+
 # Security violation error patterns for reliable detection in engine
 SECURITY_VIOLATION_PATTERNS = {
     'quota', 'limit', 'security', 'not in allowed list', 'command blocked',
@@ -27,6 +29,19 @@ SECURITY_VIOLATION_PATTERNS = {
     'access denied', 'permission denied', 'unauthorized'
 }
 
+# All patterns as one case-insensitive alternation, so a message is scanned
+# once instead of once per pattern
+_SECURITY_VIOLATION_RE = re.compile(
+    '|'.join(re.escape(p) for p in sorted(SECURITY_VIOLATION_PATTERNS, key=len, reverse=True)),
+    re.IGNORECASE
+)
+
+
+def security_violation_match(message: str) -> bool:
+    """Return True if the message contains any SECURITY_VIOLATION_PATTERNS entry."""
+    return _SECURITY_VIOLATION_RE.search(message) is not None
+
+
 # Workflow execution constants
 DEFAULT_WORKFLOW_TIMEOUT = 1800.0  # 30 minutes in seconds
 TEMPLATE_SUBSTITUTION_MAX_DEPTH = 10
@@ -25,8 +25,11 @@ Usage:
 """
 
 import os
+import re
 import sys
-from typing import Optional, Dict, NamedTuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Dict, FrozenSet, Iterator, Mapping, NamedTuple
 from enum import Enum
 
 
@@ -46,17 +49,170 @@ class ContainerType(Enum):
     CI_OTHER = "ci_other"          # Other CI/CD
 
 
+# __slots__ dataclasses need Python 3.10+; older interpreters keep __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, eq=False, repr=False, **_SLOTS)
+class EnvironmentDetails(Mapping[str, str]):
+    """
+    Additional environment details.
+    
+    Read-only mapping of the fields that are set to their string values
+    (e.g. details["term"], details.get("namespace")), like the dict it
+    replaces. The Kubernetes fields are only set when running in a
+    Kubernetes pod.
+    """
+    pod_name: Optional[str] = None
+    namespace: Optional[str] = None
+    api_host: Optional[str] = None
+    api_port: Optional[str] = None
+    container_runtime: Optional[str] = None
+    error: Optional[str] = None  # Set if gathering Kubernetes details failed
+    container_type: str = ContainerType.NATIVE.value
+    is_tty: bool = False
+    term: str = 'none'
+    
+    def __getitem__(self, key: str) -> str:
+        value = getattr(self, key, None) if key in self.__dataclass_fields__ else None
+        if value is None:
+            raise KeyError(key)
+        return str(value)
+    
+    def __iter__(self) -> Iterator[str]:
+        """Names of the fields that are set, in declaration order."""
+        return (name for name in self.__dataclass_fields__ if getattr(self, name) is not None)
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    def __repr__(self) -> str:
+        return repr(self.as_dict())
+    
+    def as_dict(self) -> Dict[str, str]:
+        """Return the fields that are set, as strings, in declaration order."""
+        return dict(self.items())
+
+
+_DETAIL_ATTRIBUTES = frozenset(EnvironmentDetails.__dataclass_fields__) | {'as_dict'}
+
+
+class _LazyEnvironmentDetails(Mapping[str, str]):
+    """
+    EnvironmentDetails gathered on first access.
+    
+    In Kubernetes, gathering details reads the service-account namespace
+    file, which most callers never need. Reads and attribute lookups are
+    forwarded to the cached EnvironmentDetails.
+    """
+    __slots__ = ('_container_type', '_is_tty')
+    
+    def __init__(self, container_type: ContainerType, is_tty: bool):
+        self._container_type = container_type
+        self._is_tty = is_tty
+    
+    def _resolve(self) -> EnvironmentDetails:
+        return _environment_details(self._container_type, self._is_tty)
+    
+    def __getitem__(self, key: str) -> str:
+        return self._resolve()[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._resolve())
+    
+    def __len__(self) -> int:
+        return len(self._resolve())
+    
+    def __getattr__(self, name: str):
+        # Typed fields (pod_name, term, ...) and as_dict(); anything else
+        # (including dunder probes from copy/pickle) is a plain miss
+        if name in _DETAIL_ATTRIBUTES:
+            return getattr(self._resolve(), name)
+        raise AttributeError(name)
+    
+    def __repr__(self) -> str:
+        return repr(self._resolve())
+
+
 class EnvironmentInfo(NamedTuple):
-    """Information about current environment."""
+    """
+    Information about current environment.
+    
+    Detection runs once per process, so the same snapshot is shared by
+    every caller.
+    """
     container_type: ContainerType
     is_tty: bool
     is_ci: bool
     color_capable: bool
     has_unicode_support: bool
     run_as_root: bool
-    details: Dict[str, str]  # Additional details (namespace, pod name, etc.)
+    details: Mapping[str, str]  # Additional details (namespace, pod name, etc.), gathered on first access
 
 
+# Environment variables, marker files and the container runtime do not change
+# while the process runs, so every detector below caches its answer.
+
+def _invalidate_detection_cache() -> None:
+    """
+    Forget all cached detection results.
+    
+    For tests that modify os.environ or stdout after detection has run.
+    """
+    for detector in (_is_stdout_tty, _sentinel_set, _read_cgroup, is_docker,
+                     is_docker_rootless, is_kubernetes, _kubernetes_info, is_podman,
+                     is_podman_rootless, is_ci_environment, detect_ci_type, _detect_all,
+                     detect_environment, _environment_details, has_color_support,
+                     has_unicode_support, get_preferred_color_mode,
+                     get_preferred_symbol_mode):
+        detector.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _is_stdout_tty() -> bool:
+    """Check once whether stdout is a terminal (an isatty() syscall per call otherwise)."""
+    return sys.stdout.isatty()
+
+
+# Effective user id, read once: it does not change for the life of the process
+# (no euid on Windows, where the process is never treated as root)
+_EUID: int = os.geteuid() if sys.platform != 'win32' else -1
+_IS_ROOT: bool = _EUID == 0
+
+# Any digit, for the Kubernetes pod-name heuristic
+_DIGIT_RE = re.compile(r'\d')
+
+# Substrings of /proc/self/cgroup identifying each runtime
+# ('docker' also covers '/docker/' paths)
+_DOCKER_CGROUP_MARKERS = ('docker',)
+_PODMAN_CGROUP_MARKERS = ('podman', '/libpod/')
+
+
+# Marker files left by container runtimes
+_DOCKERENV = '/.dockerenv'
+_K8S_TOKEN = '/var/run/secrets/kubernetes.io/serviceaccount/token'
+_K8S_NAMESPACE = '/var/run/secrets/kubernetes.io/serviceaccount/namespace'
+_PODMAN_SOCKET = '/run/podman.sock'
+_SENTINELS = (_DOCKERENV, _K8S_TOKEN, _K8S_NAMESPACE, _PODMAN_SOCKET)
+
+
+@lru_cache(maxsize=1)
+def _sentinel_set() -> FrozenSet[str]:
+    """Probe all runtime marker files in one go and remember which exist."""
+    return frozenset(path for path in _SENTINELS if os.path.exists(path))
+
+
+@lru_cache(maxsize=1)
+def _read_cgroup() -> str:
+    """Read /proc/self/cgroup once for all runtime checks ('' if unavailable)."""
+    try:
+        with open('/proc/self/cgroup', 'r') as f:
+            return f.read()
+    except (OSError, IOError):
+        return ''
+
+
+@lru_cache(maxsize=1)
 def is_docker() -> bool:
     """
     Check if running in Docker container.
@@ -70,17 +226,13 @@ def is_docker() -> bool:
         True if running in Docker
     """
     # Most reliable: /.dockerenv file (Docker creates this)
-    if os.path.exists('/.dockerenv'):
+    if _DOCKERENV in _sentinel_set():
         return True
     
     # Check cgroup detection (Docker)
-    try:
-        with open('/proc/self/cgroup', 'r') as f:
-            cgroup = f.read()
-            if 'docker' in cgroup or '/docker/' in cgroup:
-                return True
-    except (OSError, IOError):
-        pass
+    cgroup = _read_cgroup()
+    if any(marker in cgroup for marker in _DOCKER_CGROUP_MARKERS):
+        return True
     
     # Check environment variables
     if os.environ.get('DOCKER_HOST') or os.environ.get('DOCKER_CONTAINER'):
@@ -89,6 +241,7 @@ def is_docker() -> bool:
     return False
 
 
+@lru_cache(maxsize=1)
 def is_docker_rootless() -> bool:
     """
     Check if running in rootless Docker.
@@ -101,7 +254,7 @@ def is_docker_rootless() -> bool:
         True if running in rootless Docker
     """
     # Rootless Docker typically runs with unprivileged user
-    if is_docker() and os.geteuid() != 0:
+    if is_docker() and not _IS_ROOT:
         return True
     
     # Check for rootless-specific socket
@@ -111,6 +264,7 @@ def is_docker_rootless() -> bool:
     return False
 
 
+@lru_cache(maxsize=1)
 def is_kubernetes() -> bool:
     """
     Check if running in Kubernetes pod.
@@ -125,7 +279,7 @@ def is_kubernetes() -> bool:
         True if running in Kubernetes
     """
     # Most reliable: K8s service account token
-    if os.path.exists('/var/run/secrets/kubernetes.io/serviceaccount/token'):
+    if _K8S_TOKEN in _sentinel_set():
         return True
     
     # K8s API server environment variable
@@ -133,12 +287,12 @@ def is_kubernetes() -> bool:
         return True
     
     # K8s namespace file
-    if os.path.exists('/var/run/secrets/kubernetes.io/serviceaccount/namespace'):
+    if _K8S_NAMESPACE in _sentinel_set():
         return True
     
     # Hostname pattern for K8s
     hostname = os.environ.get('HOSTNAME', '')
-    if 'kubernetes.io' in hostname or '-' in hostname and any(c.isdigit() for c in hostname):
+    if 'kubernetes.io' in hostname or ('-' in hostname and _DIGIT_RE.search(hostname)):
         # Could be K8s pod name (typically contains dashes and digits)
         if os.environ.get('KUBERNETES_PORT'):
             return True
@@ -152,7 +306,14 @@ def get_kubernetes_info() -> Dict[str, str]:
     
     Returns:
         Dictionary with pod_name, namespace, service_host, etc.
+        (a fresh copy callers may modify)
     """
+    return dict(_kubernetes_info())
+
+
+@lru_cache(maxsize=1)
+def _kubernetes_info() -> Dict[str, str]:
+    """Gather Kubernetes details once (see _invalidate_detection_cache)."""
     info = {}
     
     try:
@@ -161,7 +322,7 @@ def get_kubernetes_info() -> Dict[str, str]:
         
         # Get namespace
         try:
-            with open('/var/run/secrets/kubernetes.io/serviceaccount/namespace', 'r') as f:
+            with open(_K8S_NAMESPACE, 'r') as f:
                 info['namespace'] = f.read().strip()
         except (OSError, IOError):
             info['namespace'] = 'unknown'
@@ -186,6 +347,7 @@ def get_kubernetes_info() -> Dict[str, str]:
     return info
 
 
+@lru_cache(maxsize=1)
 def is_podman() -> bool:
     """
     Check if running in Podman container.
@@ -199,17 +361,13 @@ def is_podman() -> bool:
         True if running in Podman
     """
     # Check Podman socket
-    if os.path.exists('/run/podman.sock'):
+    if _PODMAN_SOCKET in _sentinel_set():
         return True
     
     # Podman-specific cgroup markers
-    try:
-        with open('/proc/self/cgroup', 'r') as f:
-            cgroup = f.read()
-            if 'podman' in cgroup or '/libpod/' in cgroup:
-                return True
-    except (OSError, IOError):
-        pass
+    cgroup = _read_cgroup()
+    if any(marker in cgroup for marker in _PODMAN_CGROUP_MARKERS):
+        return True
     
     # Podman environment variables
     if os.environ.get('PODMAN_CONTAINER'):
@@ -218,6 +376,7 @@ def is_podman() -> bool:
     return False
 
 
+@lru_cache(maxsize=1)
 def is_podman_rootless() -> bool:
     """
     Check if running in rootless Podman.
@@ -225,12 +384,27 @@ def is_podman_rootless() -> bool:
     Returns:
         True if running in rootless Podman
     """
-    if is_podman() and os.geteuid() != 0:
+    if is_podman() and not _IS_ROOT:
         return True
     
     return False
 
 
+# Environment variables set by specific CI platforms, in detection order
+_CI_MARKERS = (
+    ('GITHUB_ACTIONS', ContainerType.CI_GITHUB),
+    ('GITLAB_CI', ContainerType.CI_GITLAB),
+    ('JENKINS_HOME', ContainerType.CI_JENKINS),
+)
+
+# Any of these marks a CI/CD run: the platforms above plus Jenkins' BUILD_ID,
+# Travis CI, CircleCI and the generic CI / CONTINUOUS_INTEGRATION flags
+_CI_ENV_VARS = tuple(var for var, _ in _CI_MARKERS) + (
+    'BUILD_ID', 'TRAVIS', 'CIRCLECI', 'CI', 'CONTINUOUS_INTEGRATION',
+)
+
+
+@lru_cache(maxsize=1)
 def is_ci_environment() -> bool:
     """
     Check if running in CI/CD environment.
@@ -240,46 +414,47 @@ def is_ci_environment() -> bool:
     Returns:
         True if running in CI
     """
-    # GitHub Actions
-    if os.environ.get('GITHUB_ACTIONS'):
-        return True
-    
-    # GitLab CI
-    if os.environ.get('GITLAB_CI'):
-        return True
-    
-    # Jenkins
-    if os.environ.get('JENKINS_HOME') or os.environ.get('BUILD_ID'):
-        return True
-    
-    # Travis CI
-    if os.environ.get('TRAVIS'):
-        return True
-    
-    # CircleCI
-    if os.environ.get('CIRCLECI'):
-        return True
-    
-    # Generic CI detection
-    if os.environ.get('CI') or os.environ.get('CONTINUOUS_INTEGRATION'):
-        return True
-    
-    return False
+    return any(os.environ.get(var) for var in _CI_ENV_VARS)
 
 
+@lru_cache(maxsize=1)
 def detect_ci_type() -> Optional[ContainerType]:
     """Detect specific CI/CD platform."""
-    if os.environ.get('GITHUB_ACTIONS'):
-        return ContainerType.CI_GITHUB
-    if os.environ.get('GITLAB_CI'):
-        return ContainerType.CI_GITLAB
-    if os.environ.get('JENKINS_HOME'):
-        return ContainerType.CI_JENKINS
+    for var, ci_type in _CI_MARKERS:
+        if os.environ.get(var):
+            return ci_type
     if is_ci_environment():
         return ContainerType.CI_OTHER
     return None
 
 
+class _DetectedState(NamedTuple):
+    """Result of every container/CI detector, evaluated once."""
+    kubernetes: bool
+    docker: bool
+    docker_rootless: bool
+    podman: bool
+    podman_rootless: bool
+    is_ci: bool
+    ci_type: Optional[ContainerType]
+
+
+@lru_cache(maxsize=1)
+def _detect_all() -> _DetectedState:
+    """Run each detector exactly once and keep the results together."""
+    docker = is_docker()
+    podman = is_podman()
+    return _DetectedState(
+        kubernetes=is_kubernetes(),
+        docker=docker,
+        docker_rootless=docker and is_docker_rootless(),
+        podman=podman,
+        podman_rootless=podman and is_podman_rootless(),
+        is_ci=is_ci_environment(),
+        ci_type=detect_ci_type(),
+    )
+
+
 def detect_container_type() -> ContainerType:
     """
     Detect what type of container/environment we're running in.
@@ -294,50 +469,39 @@ def detect_container_type() -> ContainerType:
     Returns:
         ContainerType enum value
     """
-    # Check Kubernetes first (might be running as K8s pod)
-    if is_kubernetes():
-        # Could be K8s with Docker/Podman runtime
-        if is_docker():
+    state = _detect_all()
+    
+    # Check Kubernetes first (might be running as K8s pod), with its runtime
+    if state.kubernetes:
+        if state.docker:
             return ContainerType.KUBERNETES_DOCKER
-        elif is_podman():
+        if state.podman:
             return ContainerType.KUBERNETES_PODMAN
-        else:
-            return ContainerType.KUBERNETES
+        return ContainerType.KUBERNETES
     
-    # Check Docker
-    if is_docker():
-        if is_docker_rootless():
-            return ContainerType.DOCKER_ROOTLESS
-        else:
-            return ContainerType.DOCKER
+    if state.docker:
+        return ContainerType.DOCKER_ROOTLESS if state.docker_rootless else ContainerType.DOCKER
     
-    # Check Podman
-    if is_podman():
-        if is_podman_rootless():
-            return ContainerType.PODMAN_ROOTLESS
-        else:
-            return ContainerType.PODMAN
-    
-    # Check CI/CD
-    ci_type = detect_ci_type()
-    if ci_type:
-        return ci_type
+    if state.podman:
+        return ContainerType.PODMAN_ROOTLESS if state.podman_rootless else ContainerType.PODMAN
     
-    # Default: native
-    return ContainerType.NATIVE
+    # CI/CD, or native by default
+    return state.ci_type or ContainerType.NATIVE
 
 
+@lru_cache(maxsize=1)
 def detect_environment() -> EnvironmentInfo:
     """
     Detect full environment information.
     
+    Detection runs once per process (see _invalidate_detection_cache).
+    
     Returns:
         EnvironmentInfo with container type, TTY status, etc.
     """
     container_type = detect_container_type()
-    is_tty = sys.stdout.isatty()
-    is_ci = is_ci_environment()
-    is_root = os.geteuid() == 0 if sys.platform != 'win32' else False
+    is_tty = _is_stdout_tty()
+    is_ci = _detect_all().is_ci
     
     # Determine color capability
     color_capable = has_color_support()
@@ -345,29 +509,38 @@ def detect_environment() -> EnvironmentInfo:
     # Determine unicode support
     has_unicode = has_unicode_support()
     
-    # Gather additional details
-    details = {}
-    
-    if container_type in (ContainerType.KUBERNETES, 
-                         ContainerType.KUBERNETES_DOCKER,
-                         ContainerType.KUBERNETES_PODMAN):
-        details.update(get_kubernetes_info())
-    
-    details['container_type'] = container_type.value
-    details['is_tty'] = str(is_tty)
-    details['term'] = os.environ.get('TERM', 'none')
-    
     return EnvironmentInfo(
         container_type=container_type,
         is_tty=is_tty,
         is_ci=is_ci,
         color_capable=color_capable,
         has_unicode_support=has_unicode,
-        run_as_root=is_root,
-        details=details
+        run_as_root=_IS_ROOT,
+        details=_LazyEnvironmentDetails(container_type, is_tty),
+    )
+
+
+_KUBERNETES_TYPES = frozenset((
+    ContainerType.KUBERNETES,
+    ContainerType.KUBERNETES_DOCKER,
+    ContainerType.KUBERNETES_PODMAN,
+))
+
+
+@lru_cache(maxsize=4)
+def _environment_details(container_type: ContainerType, is_tty: bool) -> EnvironmentDetails:
+    """Gather EnvironmentInfo.details once per detected environment."""
+    kubernetes_info = _kubernetes_info() if container_type in _KUBERNETES_TYPES else {}
+    
+    return EnvironmentDetails(
+        **kubernetes_info,
+        container_type=container_type.value,
+        is_tty=is_tty,
+        term=os.environ.get('TERM', 'none'),
     )
 
 
+@lru_cache(maxsize=1)
 def has_color_support() -> bool:
     """
     Check if terminal supports colors.
@@ -395,15 +568,20 @@ def has_color_support() -> bool:
         return not os.environ.get('NO_COLOR')
     
     # Default: check if TTY
-    return sys.stdout.isatty()
+    return _is_stdout_tty()
 
 
+# Locale variables consulted for a UTF-8 encoding
+_LOCALE_VARS = ('LC_ALL', 'LANG', 'LC_CTYPE')
+
+
+@lru_cache(maxsize=1)
 def has_unicode_support() -> bool:
     """
     Check if terminal supports Unicode.
     
     Checks:
-    - LANG/LC_ALL environment variables
+    - LC_ALL/LANG/LC_CTYPE environment variables
     - TERM variable
     - Platform detection
     
@@ -415,27 +593,17 @@ def has_unicode_support() -> bool:
     if term == 'dumb':
         return False
     
-    # Check locale
-    lang = os.environ.get('LANG', '')
-    if 'utf' in lang.lower() or 'utf8' in lang.lower():
-        return True
-    
-    lc_all = os.environ.get('LC_ALL', '')
-    if 'utf' in lc_all.lower():
-        return True
-    
-    # TERM usually indicates unicode support
-    if term and term != 'dumb':
-        return True
-    
-    # Windows usually has unicode in console
-    if sys.platform == 'win32':
-        return True
+    # Check locale ('utf' covers both UTF-8 and UTF8 spellings)
+    for var in _LOCALE_VARS:
+        if 'utf' in os.environ.get(var, '').casefold():
+            return True
     
-    # Default for modern systems
+    # Otherwise a set TERM usually indicates unicode support, Windows
+    # consoles have it, and it is the default for modern systems
     return True
 
 
+@lru_cache(maxsize=1)
 def get_preferred_color_mode() -> str:
     """
     Get recommended color/symbol mode based on environment.
@@ -449,27 +617,27 @@ def get_preferred_color_mode() -> str:
         - 'default' for native TTY
         - 'no-color' for CI without colors
     """
-    env = detect_environment()
-    
     # Respect explicit settings
     if os.environ.get('NO_COLOR'):
         return 'none'
     
-    if os.environ.get('AKIOS_THEME'):
-        return os.environ.get('AKIOS_THEME')
+    theme = os.environ.get('AKIOS_THEME')
+    if theme:
+        return theme
     
     # CI environments prefer dark (high contrast)
-    if env.is_ci:
+    if _detect_all().is_ci:
         return 'dark'
     
     # Containers prefer dark (high contrast)
-    if env.container_type != ContainerType.NATIVE:
+    if detect_container_type() != ContainerType.NATIVE:
         return 'dark'
     
     # Default for native
     return 'default'
 
 
+@lru_cache(maxsize=1)
 def get_preferred_symbol_mode() -> Optional[str]:
     """
     Get recommended symbol mode based on environment.
@@ -482,20 +650,19 @@ def get_preferred_symbol_mode() -> Optional[str]:
         - 'ascii' for CI (maximum compatibility)
         - None for native (use platform default)
     """
-    if os.environ.get('AKIOS_SYMBOL_MODE'):
-        return os.environ.get('AKIOS_SYMBOL_MODE')
+    symbol_mode = os.environ.get('AKIOS_SYMBOL_MODE')
+    if symbol_mode:
+        return symbol_mode
     
     if os.environ.get('NO_SYMBOLS'):
         return None
     
-    env = detect_environment()
-    
     # ASCII mode for CI (maximum compatibility)
-    if env.is_ci:
+    if _detect_all().is_ci:
         return 'ascii'
     
     # Unicode for containers (good compatibility, shape-based)
-    if env.container_type != ContainerType.NATIVE:
+    if detect_container_type() != ContainerType.NATIVE:
         return 'unicode'
     
     # Default: no forced mode
@@ -505,31 +672,47 @@ def get_preferred_symbol_mode() -> Optional[str]:
 def print_environment_info() -> None:
     """Print environment detection information (for debugging)."""
     env = detect_environment()
-    
-    print(f"\n{'='*60}")
-    print(f"AKIOS Environment Detection")
-    print(f"{'='*60}")
-    print(f"Container Type:    {env.container_type.value}")
-    print(f"Is TTY:            {env.is_tty}")
-    print(f"Is CI:             {env.is_ci}")
-    print(f"Color Support:     {env.color_capable}")
-    print(f"Unicode Support:   {env.has_unicode_support}")
-    print(f"Run as Root:       {env.run_as_root}")
-    
-    print(f"\nEnvironment Details:")
-    for key, value in env.details.items():
-        print(f"  {key}: {value}")
-    
-    print(f"\nRecommended Settings:")
-    print(f"  Theme:        {get_preferred_color_mode()}")
-    print(f"  Symbol Mode:  {get_preferred_symbol_mode() or 'default'}")
-    print(f"{'='*60}\n")
+    separator = '=' * 60
+    
+    # Assemble the whole report and write it in one call
+    lines = [
+        f"\n{separator}",
+        "AKIOS Environment Detection",
+        separator,
+        f"Container Type:    {env.container_type.value}",
+        f"Is TTY:            {env.is_tty}",
+        f"Is CI:             {env.is_ci}",
+        f"Color Support:     {env.color_capable}",
+        f"Unicode Support:   {env.has_unicode_support}",
+        f"Run as Root:       {env.run_as_root}",
+        "\nEnvironment Details:",
+    ]
+    lines.extend(f"  {key}: {value}" for key, value in env.details.as_dict().items())
+    lines += [
+        "\nRecommended Settings:",
+        f"  Theme:        {get_preferred_color_mode()}",
+        f"  Symbol Mode:  {get_preferred_symbol_mode() or 'default'}",
+        f"{separator}\n",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+# Recommended settings resolved at import when AKIOS_EAGER_DETECT=1, so
+# short-lived CLI paths can read plain constants; None otherwise (call
+# get_preferred_color_mode() / get_preferred_symbol_mode() instead)
+PREFERRED_COLOR_MODE: Optional[str] = None
+PREFERRED_SYMBOL_MODE: Optional[str] = None
+
+if os.environ.get('AKIOS_EAGER_DETECT') == '1':
+    PREFERRED_COLOR_MODE = get_preferred_color_mode()
+    PREFERRED_SYMBOL_MODE = get_preferred_symbol_mode()
 
 
 # Export public API
 __all__ = [
     "ContainerType",
     "EnvironmentInfo",
+    "EnvironmentDetails",
     "is_docker",
     "is_docker_rootless",
     "is_kubernetes",
@@ -545,4 +728,6 @@ __all__ = [
     "get_preferred_color_mode",
     "get_preferred_symbol_mode",
     "print_environment_info",
+    "PREFERRED_COLOR_MODE",
+    "PREFERRED_SYMBOL_MODE",
 ]
@@ -22,7 +22,7 @@ Loads settings from environment variables with optional YAML/JSON file override.
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from .settings import Settings
 from .defaults import DEFAULT_SETTINGS
@@ -32,6 +32,9 @@ from .themes import load_theme, resolve_theme_from_env
 # Cache for .env file parsing to avoid reading twice
 _env_cache = {}
 
+# config_file -> (environment fingerprint after loading, validated Settings)
+_settings_cache: Dict[Optional[str], Tuple[tuple, Settings]] = {}
+
 # ANSI color codes for better error messages
 try:
     from ..core.ui.rich_output import get_theme_ansi, ANSI_RESET
@@ -199,6 +202,16 @@ def _convert_pydantic_errors(error_str: str) -> str:
     return f"{colored_error('Configuration error:')} Invalid settings detected. Please check your configuration values."
 
 
+# Map API key env vars → (provider, default_model), in priority order
+_PROVIDER_API_KEYS = (
+    ("GROK_API_KEY", "grok", "grok-3"),
+    ("OPENAI_API_KEY", "openai", "gpt-4o-mini"),
+    ("ANTHROPIC_API_KEY", "anthropic", "claude-sonnet-4-20250514"),
+    ("MISTRAL_API_KEY", "mistral", "mistral-small-latest"),
+    ("GEMINI_API_KEY", "gemini", "gemini-2.0-flash"),
+)
+
+
 def _auto_detect_llm_provider(settings: Settings) -> None:
     """
     Auto-detect LLM provider and model from API key environment variables.
@@ -220,16 +233,7 @@ def _auto_detect_llm_provider(settings: Settings) -> None:
     if os.environ.get("AKIOS_LLM_PROVIDER"):
         return
 
-    # Map API key env vars → (provider, default_model)
-    _provider_map = [
-        ("GROK_API_KEY", "grok", "grok-3"),
-        ("OPENAI_API_KEY", "openai", "gpt-4o-mini"),
-        ("ANTHROPIC_API_KEY", "anthropic", "claude-sonnet-4-20250514"),
-        ("MISTRAL_API_KEY", "mistral", "mistral-small-latest"),
-        ("GEMINI_API_KEY", "gemini", "gemini-2.0-flash"),
-    ]
-
-    for env_var, provider, default_model in _provider_map:
+    for env_var, provider, default_model in _PROVIDER_API_KEYS:
         if os.environ.get(env_var):
             object.__setattr__(settings, "llm_provider", provider)
             os.environ["AKIOS_LLM_PROVIDER"] = provider
@@ -259,7 +263,52 @@ def get_settings(config_file: Optional[str] = None) -> Settings:
     Raises:
         ValueError: If config is invalid
         FileNotFoundError: If specified config file doesn't exist
+
+    The validated settings are cached; each call returns a deep copy of the
+    cached instance. They are reloaded when the working directory, the
+    config file or .env (modification time), or any AKIOS_* / provider API
+    key environment variable differs from what it was right after the last
+    load; call clear_settings_cache() to force a reload otherwise.
     """
+    fingerprint = _settings_fingerprint(config_file)
+    cached = _settings_cache.get(config_file)
+    if cached is None or cached[0] != fingerprint:
+        settings = _load_settings(config_file)
+        # Taken after loading: .env and provider auto-detection set
+        # environment variables that would otherwise invalidate the entry
+        cached = (_settings_fingerprint(config_file), settings)
+        _settings_cache[config_file] = cached
+    return cached[1].model_copy(deep=True)
+
+
+def clear_settings_cache() -> None:
+    """Forget cached settings so the next get_settings() reloads them."""
+    _settings_cache.clear()
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    """Modification time and size of a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _settings_fingerprint(config_file: Optional[str]) -> tuple:
+    """Everything get_settings() reads, reduced to a hashable cache key."""
+    environ = os.environ
+    return (
+        os.getcwd(),
+        _file_stamp(config_file or "config.yaml"),
+        _file_stamp(".env"),
+        tuple(sorted(item for item in environ.items() if item[0].startswith("AKIOS_"))),
+        tuple(environ.get(env_var) for env_var, _, _ in _PROVIDER_API_KEYS),
+    )
+
+
+def _load_settings(config_file: Optional[str] = None) -> Settings:
+    """Load, validate and apply settings (uncached body of get_settings)."""
     # Load config file first if provided
     file_config = {}
     if config_file:
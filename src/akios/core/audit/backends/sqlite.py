@@ -10,17 +10,39 @@ IMPORTANT: JSONL remains the primary backend. SQLite is ADDITIONAL storage.
 The Merkle chain lives in JSONL. SQLite enables queryable audit data.
 
 Usage: AKIOS_AUDIT_BACKEND=sqlite
+
+Events are buffered and written in batches: one transaction per
+_FLUSH_EVENTS events or per _FLUSH_INTERVAL seconds, whichever comes first.
+Queries, close() and interpreter exit drain the buffer first.
 """
 
-import json
+import atexit
 import logging
 import sqlite3
+import threading
+import weakref
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from akios.core.utils.fast_json import dumps_metadata
 
 logger = logging.getLogger(__name__)
 
 
+# Flush once this many events are buffered...
+_FLUSH_EVENTS = 256
+# ...or this many seconds after the first buffered event
+_FLUSH_INTERVAL = 0.5
+# Events kept for retry after failed flushes; older ones are dropped beyond this
+_MAX_PENDING = 16 * _FLUSH_EVENTS
+
+_INSERT_SQL = """
+    INSERT INTO audit_events (event_id, timestamp, workflow_id, step, agent, action, result, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 class SQLiteBackend:
     """
     SQLite secondary audit backend.
@@ -33,6 +55,15 @@ class SQLiteBackend:
         self._conn: Optional[sqlite3.Connection] = None
         self._initialized = False
 
+        # Pending INSERT rows, flushed in one transaction (thread-safe)
+        self._buf: Deque[Tuple[Any, ...]] = deque()
+        self._buf_lock = threading.Lock()
+        self._db_lock = threading.Lock()  # Serializes use of the shared connection
+        self._flush_timer: Optional[threading.Timer] = None
+
+        # Drained by the module's shutdown handler if still alive at exit
+        _LIVE_BACKENDS.add(self)
+
     def _get_db_path(self) -> str:
         if self._db_path:
             return self._db_path
@@ -52,6 +83,11 @@ class SQLiteBackend:
             db_path = self._get_db_path()
             Path(db_path).parent.mkdir(parents=True, exist_ok=True)
             self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            # WAL + NORMAL: one sync per checkpoint instead of two per commit
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn.execute("PRAGMA mmap_size=268435456")
             self._conn.execute("""
                 CREATE TABLE IF NOT EXISTS audit_events (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -84,6 +120,7 @@ class SQLiteBackend:
 
         If event_data contains 'akios_hash', stores it in metadata for
         cross-verification with EnforceCore's verify_chain(skip_entry_hash=True).
+        The row is buffered and committed with the next batch (see _flush).
         """
         try:
             if not self._ensure_initialized():
@@ -93,10 +130,7 @@ class SQLiteBackend:
             akios_hash = event_data.get("akios_hash", "")
             if akios_hash:
                 metadata["akios_merkle_hash"] = akios_hash
-            self._conn.execute("""
-                INSERT INTO audit_events (event_id, timestamp, workflow_id, step, agent, action, result, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            row = (
                 event_data.get("event_id", ""),
                 event_data.get("timestamp", ""),
                 event_data.get("workflow_id", ""),
@@ -104,16 +138,65 @@ class SQLiteBackend:
                 event_data.get("agent", ""),
                 event_data.get("action", ""),
                 event_data.get("result", ""),
-                json.dumps(metadata, default=str),
-            ))
-            self._conn.commit()
+                dumps_metadata(metadata),
+            )
+            with self._buf_lock:
+                self._buf.append(row)
+                pending = len(self._buf)
+                if self._flush_timer is None and pending < _FLUSH_EVENTS:
+                    self._flush_timer = threading.Timer(_FLUSH_INTERVAL, self._flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+            # Flush outside the buffer lock so other writers keep buffering meanwhile
+            if pending >= _FLUSH_EVENTS:
+                self._flush()
         except Exception as e:
             logger.debug("SQLite write_event error (non-fatal): %s", e)
 
+    def _flush(self) -> None:
+        """Write all buffered events in a single transaction (thread-safe)."""
+        # Batches are taken and written under the connection lock so they
+        # reach the table in the order they were buffered
+        with self._db_lock:
+            with self._buf_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                if not self._buf:
+                    return
+                rows = list(self._buf)
+                self._buf.clear()
+
+            if self._conn is None:
+                logger.warning("SQLite audit backend closed: %d buffered events lost", len(rows))
+                return
+            try:
+                self._conn.executemany(_INSERT_SQL, rows)
+                self._conn.commit()
+            except Exception as e:
+                try:
+                    self._conn.rollback()
+                except Exception:
+                    pass
+                self._requeue(rows, e)
+
+    def _requeue(self, rows: List[Tuple[Any, ...]], error: Exception) -> None:
+        """Put a failed batch back at the front of the buffer for the next flush."""
+        with self._buf_lock:
+            self._buf.extendleft(reversed(rows))
+            lost = len(self._buf) - _MAX_PENDING
+            for _ in range(max(lost, 0)):
+                self._buf.popleft()
+        if lost > 0:
+            logger.warning("SQLite flush failed, %d oldest buffered events lost: %s", lost, error)
+        else:
+            logger.debug("SQLite flush failed, %d events kept for retry: %s", len(rows), error)
+
     def query_events(self, workflow_id: Optional[str] = None, limit: int = 1000) -> List[Dict]:
         """Query audit events from SQLite."""
         if not self._ensure_initialized():
             return []
+        self._flush()  # Include events still waiting in the buffer
         try:
             if workflow_id:
                 cursor = self._conn.execute(
@@ -135,10 +218,29 @@ class SQLiteBackend:
         return self._ensure_initialized()
 
     def close(self) -> None:
-        if self._conn:
-            try:
-                self._conn.close()
-            except Exception:
-                pass
-            self._conn = None
-            self._initialized = False
+        self._flush()
+        with self._db_lock:
+            with self._buf_lock:
+                if self._buf:
+                    logger.warning("SQLite audit backend closed: %d buffered events lost", len(self._buf))
+                    self._buf.clear()
+            if self._conn:
+                try:
+                    self._conn.close()
+                except Exception:
+                    pass
+                self._conn = None
+                self._initialized = False
+
+
+# Backends that may still hold buffered events; weak so instances can be freed
+_LIVE_BACKENDS: "weakref.WeakSet[SQLiteBackend]" = weakref.WeakSet()
+
+
+def _close_live_backends() -> None:
+    """Flush and close every backend still alive at interpreter exit."""
+    for backend in list(_LIVE_BACKENDS):
+        backend.close()
+
+
+atexit.register(_close_live_backends)
@@ -19,7 +19,7 @@ import logging
 from typing import Any, Callable, Dict
 
 from akios.config.constants import (
-    SECURITY_VIOLATION_PATTERNS,
+    security_violation_match,
     AUDIT_ERROR_CONTEXT_KEY,
     AUDIT_EXECUTION_TIME_KEY,
 )
@@ -235,8 +235,7 @@ def check_step_security_violation(step_result: Dict[str, Any], step_id: int) ->
     """Check if step result contains a security violation."""
     if step_result.get('status') == 'error':
         error_msg = step_result.get('error', 'Unknown error')
-        error_lower = error_msg.lower()
-        if any(pattern in error_lower for pattern in SECURITY_VIOLATION_PATTERNS):
+        if security_violation_match(error_msg):
             raise RuntimeError(f"Security violation in step {step_id}: {error_msg}")
 
 
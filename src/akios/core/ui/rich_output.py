@@ -6,6 +6,7 @@ import re
 import sys
 import time
 import contextlib
+import functools
 from typing import Any, Dict, List, Optional
 
 try:
@@ -39,9 +40,13 @@ def _strip_rich_markup(text: str) -> str:
     """Remove Rich markup tags like [bold], [dim], [/#04B1DC], [/], etc."""
     return re.sub(r'\[/?[^\]]*\]', '', text)
 
+@functools.lru_cache(maxsize=1)
 def _should_use_rich() -> bool:
     """
     Determine if Rich UI should be used based on environment.
+
+    The environment and TTY state are fixed for the process, so the decision
+    is made once; call ``_should_use_rich.cache_clear()`` to re-evaluate.
     """
     if not RICH_AVAILABLE:
         return False
@@ -56,6 +61,7 @@ def _should_use_rich() -> bool:
         return False
     return True
 
+@functools.lru_cache(maxsize=32)
 def get_theme_color(name: str) -> str:
     """
     Get color for semantic theme element.
@@ -85,6 +91,7 @@ def hex_to_rgb(hex_color: str) -> tuple:
         hex_color = ''.join([c*2 for c in hex_color])
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
+@functools.lru_cache(maxsize=32)
 def get_theme_ansi(name: str) -> str:
     """
     Get ANSI escape code for semantic theme element.
@@ -100,7 +107,6 @@ def get_theme_ansi(name: str) -> str:
         ansi_codes.append("2")
         
     # Handle color
-    import re
     hex_match = re.search(r'#(?:[0-9a-fA-F]{3}){1,2}', style)
     if hex_match:
         hex_color = hex_match.group(0)
@@ -0,0 +1,30 @@
+# Copyright (C) 2025-2026 AKIOUD AI, SAS <contact@akioud.ai>
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Optional orjson support shared by JSON-heavy paths.
+
+orjson (the ``performance`` extra) is used when installed; callers fall back
+to the stdlib json module when ORJSON_AVAILABLE is False or orjson rejects
+a value.
+"""
+
+import json
+from typing import Any, Dict
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def dumps_metadata(metadata: Dict[str, Any]) -> str:
+    """Serialize audit event metadata to compact JSON text (unknown types via str())."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(metadata, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; stdlib handles them below
+    return json.dumps(metadata, default=str)
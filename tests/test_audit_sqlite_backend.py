@@ -0,0 +1,130 @@
+"""Regression tests for batched writes in the SQLite audit backend."""
+
+import gc
+import sqlite3
+import subprocess
+import sys
+import time
+import weakref
+
+import pytest
+
+from akios.core.audit.backends import sqlite as sqlite_backend
+from akios.core.audit.backends.sqlite import SQLiteBackend
+
+
+def _stored_event_ids(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return [row[0] for row in conn.execute("SELECT event_id FROM audit_events ORDER BY id")]
+    finally:
+        conn.close()
+
+
+class _FailingConnection:
+    """Stands in for the connection while the database rejects writes."""
+
+    def executemany(self, sql, rows):
+        raise sqlite3.OperationalError("database is locked")
+
+    def rollback(self):
+        pass
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "audit_events.db")
+
+
+@pytest.fixture
+def backend(db_path):
+    backend = SQLiteBackend(db_path)
+    yield backend
+    backend.close()
+
+
+def test_flushes_when_batch_size_reached(monkeypatch, backend, db_path):
+    monkeypatch.setattr(sqlite_backend, "_FLUSH_EVENTS", 4)
+    monkeypatch.setattr(sqlite_backend, "_FLUSH_INTERVAL", 60.0)
+
+    for i in range(3):
+        backend.write_event({"event_id": f"e{i}"})
+    assert _stored_event_ids(db_path) == []
+
+    backend.write_event({"event_id": "e3"})
+    assert _stored_event_ids(db_path) == ["e0", "e1", "e2", "e3"]
+
+
+def test_flushes_after_interval(monkeypatch, backend, db_path):
+    monkeypatch.setattr(sqlite_backend, "_FLUSH_INTERVAL", 0.05)
+
+    backend.write_event({"event_id": "timed"})
+
+    deadline = time.monotonic() + 5.0
+    while not _stored_event_ids(db_path) and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert _stored_event_ids(db_path) == ["timed"]
+
+
+def test_failed_flush_requeues_batch_in_order(monkeypatch, backend, db_path):
+    monkeypatch.setattr(sqlite_backend, "_FLUSH_INTERVAL", 60.0)
+    backend.write_event({"event_id": "a"})
+    backend.write_event({"event_id": "b"})
+
+    real_conn = backend._conn
+    backend._conn = _FailingConnection()
+    backend._flush()
+    assert len(backend._buf) == 2
+
+    backend._conn = real_conn
+    backend.write_event({"event_id": "c"})
+    backend._flush()
+    assert _stored_event_ids(db_path) == ["a", "b", "c"]
+
+
+def test_failed_flush_keeps_at_most_max_pending(monkeypatch, backend, db_path):
+    monkeypatch.setattr(sqlite_backend, "_FLUSH_INTERVAL", 60.0)
+    monkeypatch.setattr(sqlite_backend, "_MAX_PENDING", 3)
+    for i in range(5):
+        backend.write_event({"event_id": f"e{i}"})
+
+    real_conn = backend._conn
+    backend._conn = _FailingConnection()
+    backend._flush()
+    backend._conn = real_conn
+
+    backend._flush()
+    assert _stored_event_ids(db_path) == ["e2", "e3", "e4"]
+
+
+def test_query_events_includes_buffered_events(monkeypatch, backend):
+    monkeypatch.setattr(sqlite_backend, "_FLUSH_INTERVAL", 60.0)
+    backend.write_event({"event_id": "pending", "workflow_id": "wf"})
+
+    events = backend.query_events(workflow_id="wf")
+    assert [event["event_id"] for event in events] == ["pending"]
+
+
+def test_pending_events_written_at_interpreter_exit(db_path):
+    script = (
+        "from akios.core.audit.backends.sqlite import SQLiteBackend\n"
+        f"backend = SQLiteBackend({db_path!r})\n"
+        "for i in range(3):\n"
+        "    backend.write_event({'event_id': f'exit{i}'})\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, timeout=60)
+
+    assert _stored_event_ids(db_path) == ["exit0", "exit1", "exit2"]
+
+
+def test_closed_backend_is_not_kept_alive(db_path):
+    backend = SQLiteBackend(db_path)
+    backend.write_event({"event_id": "x"})
+    backend.close()
+    ref = weakref.ref(backend)
+
+    del backend
+    gc.collect()
+
+    assert ref() is None
+    assert _stored_event_ids(db_path) == ["x"]
@@ -0,0 +1,41 @@
+"""Regression tests for subcommand sniffing in the CLI parser."""
+
+import argparse
+
+import pytest
+
+from akios.cli.main import _sniff_subcommand, create_parser
+
+
+def _registered_commands(parser):
+    subparsers = next(a for a in parser._actions if isinstance(a, argparse._SubParsersAction))
+    return set(subparsers.choices)
+
+
+@pytest.mark.parametrize("argv, expected", [
+    (["status", "--security"], "status"),
+    (["--debug", "logs", "--limit", "5"], "logs"),
+    (["--version"], None),
+    ([], None),
+])
+def test_sniff_subcommand(argv, expected):
+    assert _sniff_subcommand(argv) == expected
+
+
+def test_known_command_registers_only_that_command():
+    parser = create_parser(["status", "--security"])
+
+    assert _registered_commands(parser) == {"status"}
+    assert parser.parse_args(["status"]).command == "status"
+
+
+def test_version_alone_registers_no_commands():
+    assert _registered_commands(create_parser(["--version"])) == set()
+
+
+@pytest.mark.parametrize("argv", [[], ["--help"], ["--version", "--help"], ["no-such-command"]])
+def test_help_missing_or_unknown_command_registers_all(argv):
+    full = _registered_commands(create_parser(argv))
+
+    assert {"status", "run", "init"} <= full
+    assert full == _registered_commands(create_parser(["--help"]))
@@ -0,0 +1,97 @@
+"""Regression tests for settings caching in the config loader."""
+
+import os
+
+import pytest
+
+from akios.config import loader
+from akios.config.loader import clear_settings_cache, get_settings
+
+_PROVIDER_KEYS = ("GROK_API_KEY", "OPENAI_API_KEY", "ANTHROPIC_API_KEY",
+                  "MISTRAL_API_KEY", "GEMINI_API_KEY")
+
+
+@pytest.fixture(autouse=True)
+def isolated_settings(monkeypatch, tmp_path):
+    """Run each test in an empty project with no AKIOS_* or provider variables."""
+    saved = dict(os.environ)
+    for key in list(os.environ):
+        if key.startswith("AKIOS_") or key in _PROVIDER_KEYS:
+            del os.environ[key]
+    monkeypatch.chdir(tmp_path)
+    clear_settings_cache()
+    yield
+    clear_settings_cache()
+    # load_dotenv() and provider auto-detection write to os.environ directly
+    os.environ.clear()
+    os.environ.update(saved)
+
+
+@pytest.fixture
+def load_count(monkeypatch):
+    calls = []
+    real_load = loader._load_settings
+
+    def counting_load(config_file=None):
+        calls.append(config_file)
+        return real_load(config_file)
+
+    monkeypatch.setattr(loader, "_load_settings", counting_load)
+    return calls
+
+
+def test_repeated_calls_load_once(load_count):
+    get_settings()
+    get_settings()
+
+    assert len(load_count) == 1
+
+
+def test_env_var_change_reloads(load_count):
+    assert get_settings().log_level == "INFO"
+
+    os.environ["AKIOS_LOG_LEVEL"] = "DEBUG"
+
+    assert get_settings().log_level == "DEBUG"
+    assert len(load_count) == 2
+
+
+def test_config_file_change_reloads(tmp_path, load_count):
+    config = tmp_path / "config.yaml"
+    config.write_text("environment: development\n")
+    assert get_settings().environment == "development"
+
+    config.write_text("environment: testing\n")
+    stat = config.stat()
+    os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert get_settings().environment == "testing"
+    assert len(load_count) == 2
+
+
+def test_variables_set_while_loading_do_not_invalidate(tmp_path, load_count):
+    # .env is loaded into os.environ and the provider is auto-detected from it
+    (tmp_path / ".env").write_text("GROK_API_KEY=xai-abcdefghijklmnopqrstuvwxyz\n")
+
+    first = get_settings()
+    second = get_settings()
+
+    assert first.llm_provider == second.llm_provider == "grok"
+    assert len(load_count) == 1
+
+
+def test_callers_get_independent_copies():
+    get_settings().allowed_domains.append("evil.example")
+    get_settings().allowed_commands.append("rm")
+
+    settings = get_settings()
+    assert "evil.example" not in settings.allowed_domains
+    assert "rm" not in settings.allowed_commands
+
+
+def test_clear_settings_cache_forces_reload(load_count):
+    get_settings()
+    clear_settings_cache()
+    get_settings()
+
+    assert len(load_count) == 2
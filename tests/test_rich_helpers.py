@@ -0,0 +1,47 @@
+"""Regression tests for JSON output formatting in rich_helpers."""
+
+import io
+import json
+
+import pytest
+
+from akios.cli.rich_helpers import output_json_only
+
+
+class _TTYBuffer(io.StringIO):
+    def isatty(self):
+        return True
+
+
+@pytest.fixture(autouse=True)
+def _no_pretty_override(monkeypatch):
+    monkeypatch.delenv("AKIOS_JSON_PRETTY", raising=False)
+
+
+def test_piped_output_is_compact():
+    out = io.StringIO()
+    output_json_only({"a": 1, "b": [1, 2]}, file=out)
+
+    assert out.getvalue() == '{"a":1,"b":[1,2]}\n'
+
+
+def test_terminal_output_is_indented():
+    out = _TTYBuffer()
+    output_json_only({"a": 1}, file=out)
+
+    assert out.getvalue() == '{\n  "a": 1\n}\n'
+
+
+def test_pretty_env_var_forces_indentation(monkeypatch):
+    monkeypatch.setenv("AKIOS_JSON_PRETTY", "1")
+    out = io.StringIO()
+    output_json_only({"a": 1}, file=out)
+
+    assert out.getvalue() == '{\n  "a": 1\n}\n'
+
+
+def test_non_dict_payload_is_wrapped():
+    out = io.StringIO()
+    output_json_only([1, 2], file=out)
+
+    assert json.loads(out.getvalue()) == {"result": [1, 2]}
@@ -0,0 +1,52 @@
+"""Regression tests for template search in the interactive picker."""
+
+import pytest
+
+from akios.cli import template_picker
+from akios.cli.template_picker import TemplatePicker
+
+TEMPLATES = [
+    {"name": "hello-workflow", "description": "Minimal example workflow"},
+    {"name": "document_ingestion", "description": "Extract and redact PDF documents"},
+    {"name": "batch_processing", "description": "Process many files in parallel"},
+    {"name": "file_analysis", "description": "Analyze files for security issues"},
+    {"name": "web_research", "description": "Fetch web pages and summarize them"},
+]
+
+
+def _names(templates):
+    return [t["name"] for t in templates]
+
+
+@pytest.fixture
+def picker():
+    return TemplatePicker(TEMPLATES)
+
+
+def test_empty_query_returns_first_templates(picker):
+    assert _names(picker.fuzzy_search("", limit=2)) == ["hello-workflow", "document_ingestion"]
+
+
+def test_short_query_uses_prefix_matches(picker):
+    assert _names(picker.fuzzy_search("Fi")) == ["file_analysis"]
+
+
+def test_short_query_without_prefix_match_falls_through(picker):
+    # No name starts with "pd", but the description of document_ingestion mentions PDF
+    assert _names(picker.fuzzy_search("pdf", limit=1)) == ["document_ingestion"]
+
+
+@pytest.mark.skipif(not template_picker.RAPIDFUZZ_AVAILABLE, reason="rapidfuzz not installed")
+def test_fuzzy_ranking_prefers_closest_template(picker):
+    results = picker.fuzzy_search("web reserch", limit=3)
+
+    assert _names(results)[0] == "web_research"
+    assert len(results) <= 3
+
+
+def test_substring_fallback_ranks_earliest_match_first(monkeypatch):
+    monkeypatch.setattr(template_picker, "RAPIDFUZZ_AVAILABLE", False)
+    picker = TemplatePicker(TEMPLATES)
+
+    assert _names(picker.fuzzy_search("files")) == ["file_analysis", "batch_processing"]
+    assert picker.fuzzy_search("nothing-matches") == []